@@ -32,7 +32,7 @@ from mxm.datakraken.assets.etf_universe import (
     load_isin_universe_override,
 )
 from mxm.datakraken.bootstrap import register_adapters_from_config
-from mxm.datakraken.common.file_io import read_json, write_json
+from mxm.datakraken.common.file_io import write_json
 from mxm.datakraken.common.latest_bucket import resolve_latest_bucket
 from mxm.datakraken.common.types import JSONLike
 from mxm.datakraken.sources.justetf.common.models import ETFProfileIndexEntry
@@ -48,12 +48,21 @@ def _sha256_lines(lines: Iterable[str]) -> str:
 
 
 def filter_index_by_isins(
-    index: Sequence[ETFProfileIndexEntry], isins: Sequence[str]
+    index: Iterable[ETFProfileIndexEntry], isins: Sequence[str]
 ) -> list[ETFProfileIndexEntry]:
-    """Return only entries whose ISIN is in the provided list."""
-    isins_set = set(isins)
-    subset = [entry for entry in index if entry.get("isin") in isins_set]
-    print(f"Filtered {len(subset)} of {len(index)} total entries.")
+    """Return only entries whose ISIN is in the provided list.
+
+    `index` is consumed in a single pass, so any iterable works; only the
+    (small) subset is materialized.
+    """
+    isins_set = frozenset(isins)
+    total = 0
+    subset: list[ETFProfileIndexEntry] = []
+    for entry in index:
+        total += 1
+        if entry.get("isin") in isins_set:
+            subset.append(entry)
+    print(f"Filtered {len(subset)} of {total} total entries.")
     return subset
 
 
@@ -149,7 +158,8 @@ def save_subset_index(
     latest_link = root / "latest"
 
     # Write subset
-    write_json(subset_path, cast(JSONLike, list(subset)))
+    subset_json = cast(JSONLike, list(subset))
+    write_json(subset_path, subset_json)
 
     # Meta/provenance
     meta = SubsetMeta(
@@ -167,7 +177,7 @@ def save_subset_index(
 
     # Optional convenience copy at repo root (comment out if not desired)
     convenience = base_path / "profile_index_subsets_subset_latest.json"
-    write_json(convenience, read_json(subset_path))
+    write_json(convenience, subset_json)
 
     print(
         "Saved subset snapshot to:\n"
@@ -194,18 +204,18 @@ def main(
     universe_isins = _resolve_universe_isins(cfg=cfg, cli_universe_path=universe_path)
     print(f"Universe contains {len(universe_isins)} ISINs.")
 
-    # 4) Ensure/obtain the full profile index
-    index: list[ETFProfileIndexEntry] = get_profile_index(
-        cfg=cfg, base_path=base_path, force_refresh=force_refresh
+    # 4) Ensure/obtain the full profile index, filtering it in the same pass
+    #    and dropping the full list right away so only the subset stays alive.
+    subset = filter_index_by_isins(
+        get_profile_index(cfg=cfg, base_path=base_path, force_refresh=force_refresh),
+        universe_isins,
     )
-    print(f"Profile index contains {len(index)} total entries.")
 
     # 5) Resolve the *bucket* we just used for determinism in storage
     source_bucket = resolve_latest_bucket(base_path / "profile_index")
     print(f"Resolved source bucket: {source_bucket}")
 
-    # 6) Filter + 7) Save under profile_index_subsets/<bucket>/
-    subset = filter_index_by_isins(index, universe_isins)
+    # 6) Save under profile_index_subsets/<bucket>/
     save_subset_index(
         subset=subset,
         base_path=base_path,
@@ -17,7 +17,7 @@ from __future__ import annotations
 
 import argparse
 import json
-from datetime import datetime, timezone
+import time
 from pathlib import Path
 from typing import Any, List, Sequence, cast
 
@@ -32,20 +32,20 @@ from mxm.datakraken.sources.justetf.common.models import ETFProfileIndexEntry
 def _validate_subset(items: Sequence[dict[str, Any]]) -> list[ETFProfileIndexEntry]:
     """Validate/normalize JSON-loaded items to ETFProfileIndexEntry list."""
     out: List[ETFProfileIndexEntry] = []
+    append = out.append
     for i, row in enumerate(items):
-        isin = row.get("isin")
-        url = row.get("url")
-        lastmod = row.get("lastmod")
+        get = row.get
+        isin, url, lastmod = get("isin"), get("url"), get("lastmod")
         if not isinstance(isin, str) or not isinstance(url, str):
             raise ValueError(f"subset entry #{i} missing 'isin' or 'url' (str)")
-        if lastmod is not None and not isinstance(lastmod, str):
-            raise ValueError(f"subset entry #{i} has non-str 'lastmod'")
-        entry: ETFProfileIndexEntry = (
-            {"isin": isin, "url": url, "lastmod": lastmod}
-            if lastmod is not None
-            else {"isin": isin, "url": url}
-        )
-        out.append(entry)
+        # One dict literal with a fixed key order; 'lastmod' is appended last
+        # so every entry shares the same leading key layout.
+        entry: ETFProfileIndexEntry = {"isin": isin, "url": url}
+        if lastmod is not None:
+            if not isinstance(lastmod, str):
+                raise ValueError(f"subset entry #{i} has non-str 'lastmod'")
+            entry["lastmod"] = lastmod
+        append(entry)
     return out
 
 
@@ -82,7 +82,7 @@ def main(
     subset = load_subset_index(base_path)
 
     # 4) Run the batch on this subset
-    run_id = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H-%M-%S")
+    run_id = time.strftime("%Y-%m-%dT%H-%M-%S", time.gmtime())
     snapshot_path = run_batch(
         cfg=cfg,
         base_path=base_path,
@@ -15,7 +15,7 @@ from __future__ import annotations
 import argparse
 import re
 from pathlib import Path
-from typing import Iterable, List, Set
+from typing import Iterable, List
 
 ISIN_REGEX = re.compile(r"\b[A-Z]{2}[A-Z0-9]{9}[0-9]\b")
 
@@ -59,13 +59,8 @@ def validate_isins(isins: Iterable[str]) -> List[str]:
 
 def unique_preserve_order(items: Iterable[str]) -> List[str]:
     """De-duplicate while preserving first-seen order."""
-    seen: Set[str] = set()
-    out: List[str] = []
-    for x in items:
-        if x not in seen:
-            seen.add(x)
-            out.append(x)
-    return out
+    # dict keys keep insertion order; a single C-level pass does the dedup.
+    return list(dict.fromkeys(items))
 
 
 def main() -> None:
@@ -91,7 +86,9 @@ def main() -> None:
         valid = unique_preserve_order(valid)
 
     if not args.no_sort:
-        valid = sorted(valid)
+        # ISINs are fixed-width ASCII, so plain lexicographic order is exact;
+        # sort the (already private) list in place rather than copying it.
+        valid.sort()
 
     output = "\n".join(valid)
     if args.out:
@@ -16,7 +16,8 @@ Usage examples:
 from __future__ import annotations
 
 import argparse
-import json
+import sys
+from operator import attrgetter
 from pathlib import Path
 from typing import Mapping, Sequence, cast
 
@@ -25,6 +26,7 @@ from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 
+from mxm.datakraken.common.file_io import read_json
 from mxm.datakraken.config.config import justetf_view
 from mxm.datakraken.sources.justetf.common.models import JustETFProfile
 
@@ -49,26 +51,39 @@ def _as_profile_list(obj: object) -> list[JustETFProfile]:
 def load_latest_snapshot(base_path: Path) -> list[JustETFProfile]:
     """Load the most recent profiles snapshot file."""
     profiles_dir = base_path / "profiles"
-    snapshots = sorted(profiles_dir.glob("profiles_*.json"))
-    if not snapshots:
+    latest = max(
+        profiles_dir.glob("profiles_*.json"), key=attrgetter("name"), default=None
+    )
+    if latest is None:
         raise FileNotFoundError(f"No profiles_*.json found in {profiles_dir}")
-    latest = snapshots[-1]
-    raw = json.loads(latest.read_text(encoding="utf-8"))
+    raw = read_json(latest)
     data = _as_profile_list(raw)
     console.print(f"[cyan]Loaded snapshot:[/cyan] {latest.name} ({len(data)} entries)")
     return data
 
 
 def list_isins(snapshot: Sequence[JustETFProfile]) -> None:
-    """Print all ISINs in the snapshot."""
+    """Print all ISINs in the snapshot.
+
+    When stdout is not a terminal (e.g. piped into grep), emit plain
+    tab-separated lines instead of rendering a rich table.
+    """
+    if not console.is_terminal:
+        sys.stdout.write(
+            "".join(
+                f"{i}\t{entry.get('isin', '')}\t{entry.get('name', '')}\n"
+                for i, entry in enumerate(snapshot)
+            )
+        )
+        return
+
     table = Table(title="ETF ISINs in Snapshot")
     table.add_column("Index", justify="right")
     table.add_column("ISIN", style="bold cyan")
     table.add_column("Name", style="white")
+    add_row = table.add_row
     for i, entry in enumerate(snapshot):
-        isin = entry.get("isin", "")
-        name = entry.get("name", "")
-        table.add_row(str(i), isin, name)
+        add_row(str(i), entry.get("isin", ""), entry.get("name", ""))
     console.print(table)
 
 
@@ -14,6 +14,8 @@ Usage:
 from __future__ import annotations
 
 import json
+from collections import Counter
+from operator import attrgetter
 from pathlib import Path
 from typing import Literal, Mapping, Sequence, TypedDict, cast
 
@@ -37,11 +39,13 @@ def get_latest_run_dir(runs_root: Path) -> Path:
     if not runs_root.exists():
         raise FileNotFoundError(f"No runs directory found: {runs_root}")
 
-    run_dirs = [p for p in runs_root.iterdir() if p.is_dir()]
-    if not run_dirs:
+    latest = max(
+        (p for p in runs_root.iterdir() if p.is_dir()),
+        key=attrgetter("name"),
+        default=None,
+    )
+    if latest is None:
         raise FileNotFoundError(f"No run directories found under {runs_root}")
-
-    latest = max(run_dirs, key=lambda p: p.name)
     return latest
 
 
@@ -51,33 +55,35 @@ def load_progress(run_dir: Path) -> list[ProgressRecord]:
     if not progress_file.exists():
         raise FileNotFoundError(f"No progress file found in {run_dir}")
 
+    # Stream line by line with a single reusable decoder: progress.jsonl grows
+    # with the run, so avoid materializing the whole text and its split copy.
+    decode = json.JSONDecoder().decode
     out: list[ProgressRecord] = []
-    for line in progress_file.read_text(encoding="utf-8").splitlines():
-        if not line.strip():
-            continue
-        obj = json.loads(line)
-        if not isinstance(obj, dict):
-            # Skip malformed lines
-            continue
-        rec: ProgressRecord = {
-            "isin": cast(str, obj.get("isin", "")),
-            "status": cast(
-                Literal["ok", "skip", "err", "unknown"], obj.get("status", "unknown")
-            ),
-        }
-        if "error" in obj and isinstance(obj["error"], str):
-            rec["error"] = obj["error"]
-        out.append(rec)
+    with progress_file.open("r", encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            obj = decode(line)
+            if not isinstance(obj, dict):
+                # Skip malformed lines
+                continue
+            rec: ProgressRecord = {
+                "isin": cast(str, obj.get("isin", "")),
+                "status": cast(
+                    Literal["ok", "skip", "err", "unknown"],
+                    obj.get("status", "unknown"),
+                ),
+            }
+            if "error" in obj and isinstance(obj["error"], str):
+                rec["error"] = obj["error"]
+            out.append(rec)
     return out
 
 
 def summarize_progress(progress: Sequence[ProgressRecord]) -> dict[str, int]:
     """Count ok / skip / err occurrences."""
-    counts: dict[str, int] = {"ok": 0, "skip": 0, "err": 0}
-    for record in progress:
-        status = record.get("status", "unknown")
-        if status in counts:
-            counts[status] += 1
+    tally = Counter(record.get("status", "unknown") for record in progress)
+    counts: dict[str, int] = {k: tally[k] for k in ("ok", "skip", "err")}
     counts["total"] = sum(counts.values())
     return counts
 
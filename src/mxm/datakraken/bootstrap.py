@@ -24,6 +24,8 @@ Example (`default.yaml`):
               alias: "justetf"  # registry key; use "http" if sharing a single adapter
               user_agent: "mxm-datakraken/0.2 (contact@moneyexmachina.com)"
               default_timeout: 30.0
+              pool_connections: 16  # optional; per-host pools kept alive
+              pool_maxsize: 32      # optional; connections per pool
               default_headers:
                 Accept: "*/*"
 
@@ -104,6 +106,8 @@ def register_adapters_from_config(cfg: MXMConfig, strict: bool = False) -> None:
         getattr(http, "user_agent", "mxm-datakraken/0.2 (contact@moneyexmachina.com)")
     )
     default_timeout = float(getattr(http, "default_timeout", 30.0))
+    pool_connections = int(getattr(http, "pool_connections", 16))
+    pool_maxsize = int(getattr(http, "pool_maxsize", 32))
 
     raw_headers_any = getattr(http, "default_headers", None)
     raw_headers = (
@@ -120,6 +124,8 @@ def register_adapters_from_config(cfg: MXMConfig, strict: bool = False) -> None:
                 user_agent=user_agent,
                 default_timeout=default_timeout,
                 default_headers=headers,
+                pool_connections=pool_connections,
+                pool_maxsize=pool_maxsize,
             ),
         )
     except Exception:
@@ -4,29 +4,220 @@ Lightweight JSON file I/O helpers.
 - All files are read/written as UTF-8.
 - `write_json` pretty-prints with 2-space indentation and does not escape non-ASCII.
 - Parent directories are created as needed.
+- `write_json` is atomic (temp file + ``os.replace``) and, by default, durable
+  (the temp file and its parent directory are fsync'ed). Readers never observe
+  a truncated file, even if the process dies mid-write.
+- `write_json(..., skip_unchanged=True)` elides the write when the file already
+  holds identical bytes.
+- `write_bytes` is the same atomic write for an already serialized payload (e.g.
+  from `dumps_json`, when the caller also needs the exact bytes written).
+- `write_json_array` streams a list item by item, byte-identical to
+  `write_json(path, list(items))` but without building the list or its JSON.
+- `append_jsonl` adds one compact JSON record per line to a log-style file (not
+  atomic across processes, like any append).
 - Functions surface underlying I/O and JSON errors (no silent swallowing).
+- When the optional `orjson` package is installed (``speedups`` extra) it is used
+  for (de)serialization; output is byte-compatible with the stdlib fallback.
+  Large files are then read through a memory map rather than into memory.
 """
 
 from __future__ import annotations
 
 import json
+import mmap
+import os
+import uuid
+from contextlib import contextmanager
 from pathlib import Path
-from typing import cast
+from typing import BinaryIO, Generator, Iterable, cast
 
 from mxm.types import JSONLike
 
-__all__ = ["write_json", "read_json"]
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without the extra
+    orjson = None
 
+__all__ = [
+    "dumps_json",
+    "write_bytes",
+    "write_json",
+    "write_json_array",
+    "read_json",
+    "append_jsonl",
+    "fsync_dir",
+]
 
-def write_json(path: Path, data: JSONLike) -> Path:
-    """Write JSON to disk, creating parent dirs as needed."""
+# Below this size a plain read is cheaper than setting up a mapping.
+_MMAP_MIN_BYTES = 64 * 1024
+
+
+def _dumps(data: JSONLike, *, sort_keys: bool = False) -> bytes:
+    """Serialize to pretty-printed UTF-8 JSON bytes."""
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(data, option=option)
+    text = json.dumps(data, ensure_ascii=False, indent=2, sort_keys=sort_keys)
+    return text.encode("utf-8")
+
+
+def dumps_json(data: JSONLike, *, sort_keys: bool = False) -> bytes:
+    """The exact bytes `write_json` writes for `data`."""
+    return _dumps(data, sort_keys=sort_keys)
+
+
+def _dumps_line(data: JSONLike) -> bytes:
+    """Serialize to compact single-line UTF-8 JSON bytes (no trailing newline)."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    text = json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+    return text.encode("utf-8")
+
+
+def _loads(raw: bytes) -> JSONLike:
+    """Deserialize UTF-8 JSON bytes."""
+    if orjson is not None:
+        return cast(JSONLike, orjson.loads(raw))
+    return cast(JSONLike, json.loads(raw))
+
+
+def fsync_dir(directory: Path) -> None:
+    """Flush a directory entry (rename) to stable storage; no-op on Windows."""
+    if os.name == "nt":
+        return
+    fd = os.open(directory, os.O_RDONLY | getattr(os, "O_DIRECTORY", 0))
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _has_content(path: Path, payload: bytes) -> bool:
+    """True if `path` is a file whose bytes equal `payload`."""
+    try:
+        if path.stat().st_size != len(payload):
+            return False
+        return path.read_bytes() == payload
+    except OSError:
+        return False
+
+
+def write_json(
+    path: Path,
+    data: JSONLike,
+    *,
+    sort_keys: bool = False,
+    durable: bool = True,
+    sync_dir: bool = True,
+    skip_unchanged: bool = False,
+) -> Path:
+    """Write JSON to disk atomically, creating parent dirs as needed.
+
+    The payload goes to a unique sibling temp file which then replaces `path`.
+    With `durable=True` the temp file is fsync'ed before the rename and the
+    parent directory after it; pass `durable=False` in hot loops where losing
+    the last writes on power failure is acceptable (atomicity is kept).
+    Callers writing several files into one directory can pass `sync_dir=False`
+    and call `fsync_dir` once afterwards.
+
+    With `skip_unchanged=True` nothing is written when `path` already holds
+    exactly the serialized bytes (its mtime is preserved); the existing file is
+    only read when its size matches.
+    """
+    # Serialize first so encoding errors never leave a temp file behind.
+    payload = _dumps(data, sort_keys=sort_keys)
+    return write_bytes(
+        path,
+        payload,
+        durable=durable,
+        sync_dir=sync_dir,
+        skip_unchanged=skip_unchanged,
+    )
+
+
+def write_bytes(
+    path: Path,
+    payload: bytes,
+    *,
+    durable: bool = True,
+    sync_dir: bool = True,
+    skip_unchanged: bool = False,
+) -> Path:
+    """Write `payload` to disk atomically (same options as `write_json`)."""
     path.parent.mkdir(parents=True, exist_ok=True)
-    text = json.dumps(data, ensure_ascii=False, indent=2)
-    # newline ensures consistent line endings across platforms
-    path.write_text(text, encoding="utf-8", newline="\n")
+    if skip_unchanged and _has_content(path, payload):
+        return path
+
+    with _atomic_file(path, durable=durable, sync_dir=sync_dir) as f:
+        f.write(payload)
     return path
 
 
+def write_json_array(
+    path: Path, items: Iterable[JSONLike], *, durable: bool = True
+) -> Path:
+    """Stream `items` as a pretty-printed JSON array, atomically.
+
+    Each item is serialized on its own and re-indented one level, so only one
+    item's JSON is in memory at a time; the bytes match `write_json` of the
+    materialized list (JSON strings never contain raw newlines).
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with _atomic_file(path, durable=durable) as f:
+        sep = b"[\n  "
+        for item in items:
+            f.write(sep)
+            f.write(_dumps(item).replace(b"\n", b"\n  "))
+            sep = b",\n  "
+        f.write(b"[]" if sep == b"[\n  " else b"\n]")
+    return path
+
+
+def append_jsonl(path: Path, record: JSONLike) -> None:
+    """Append one compact JSON record and a newline to `path` (created if absent)."""
+    line = _dumps_line(record) + b"\n"
+    with path.open("ab") as f:
+        f.write(line)
+
+
+@contextmanager
+def _atomic_file(
+    path: Path, *, durable: bool, sync_dir: bool = True
+) -> Generator[BinaryIO]:
+    """Yield a temp file that replaces `path` once the block exits cleanly."""
+    tmp = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            yield f
+            if durable:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+    if durable and sync_dir:
+        fsync_dir(path.parent)
+
+
 def read_json(path: Path) -> JSONLike:
-    """Read JSON from disk."""
-    return cast(JSONLike, json.loads(path.read_text(encoding="utf-8")))
+    """
+    Read JSON from disk.
+
+    With orjson, files of at least `_MMAP_MIN_BYTES` are parsed straight from a
+    read-only memory map, so the content is never copied into a bytes object.
+    """
+    if orjson is None:
+        return _loads(path.read_bytes())
+    with path.open("rb") as f:
+        if os.fstat(f.fileno()).st_size < _MMAP_MIN_BYTES:
+            return _loads(f.read())
+        with (
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped,
+            memoryview(mapped) as view,
+        ):
+            return cast(JSONLike, orjson.loads(view))
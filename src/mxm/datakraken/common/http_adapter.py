@@ -12,6 +12,8 @@ Design notes
 ------------
 - Headers are stored and exposed as ``Mapping[str, str]`` (no ``bytes`` values).
 - Default headers and timeout are injected at construction time.
+- A pooled ``HTTPAdapter`` is mounted for http/https so sequential requests to
+  the same host reuse TCP/TLS connections (keep-alive) instead of reconnecting.
 - Network/client exceptions are propagated; mxm-dataio is responsible for
   recording failures at the session boundary.
 
@@ -31,6 +33,7 @@ import requests
 from mxm.dataio.adapters import Fetcher
 from mxm.dataio.models import AdapterResult, Request
 from requests import HTTPError, Response, Session
+from requests.adapters import HTTPAdapter
 
 
 def _elapsed_ms(resp: Response) -> Optional[int]:
@@ -71,6 +74,11 @@ class HttpRequestsAdapter(Fetcher):
     default_headers:
         Mapping of default headers applied to all requests. All values must be
         ``str``; header names are handled case-insensitively by the HTTP stack.
+    pool_connections:
+        Number of per-host connection pools to cache in the mounted
+        ``HTTPAdapter``.
+    pool_maxsize:
+        Maximum number of connections kept alive per pool.
 
     Notes
     -----
@@ -90,10 +98,20 @@ class HttpRequestsAdapter(Fetcher):
         user_agent: str = "mxm-datakraken/0.2 (contact@moneyexmachina.com)",
         default_timeout: float = 30.0,
         default_headers: Optional[Mapping[str, str]] = None,
+        pool_connections: int = 16,
+        pool_maxsize: int = 32,
     ) -> None:
-        """Initialize the adapter with default headers and timeout."""
+        """Initialize the adapter with default headers, timeout and pooling."""
         self._session: Session = requests.Session()
 
+        # Pooled transport: reuse keep-alive connections across requests.
+        pooled = HTTPAdapter(
+            pool_connections=int(pool_connections),
+            pool_maxsize=int(pool_maxsize),
+        )
+        self._session.mount("https://", pooled)
+        self._session.mount("http://", pooled)
+
         # Set base defaults; allow caller overrides.
         base: dict[str, str] = {
             "User-Agent": user_agent,
@@ -17,10 +17,10 @@ Typical layout:
 from __future__ import annotations
 
 import os
+import uuid
 from pathlib import Path
 from typing import Optional
 
-
 def update_latest_pointer(root: Path, bucket: str) -> None:
     """Update `<root>/latest` to point to the given `bucket`.
 
@@ -38,18 +38,30 @@ def update_latest_pointer(root: Path, bucket: str) -> None:
     """
     latest = root / "latest"
 
+    # Re-runs into the same bucket are common; one readlink spares the swap.
     try:
-        if latest.exists() or latest.is_symlink():
-            # Don't remove a real directory accidentally
-            if latest.is_dir() and not latest.is_symlink():
-                raise RuntimeError(f"'latest' exists and is a real directory: {latest}")
-            latest.unlink(missing_ok=True)
+        if os.readlink(latest) == bucket:
+            return
+    except OSError:
+        pass
+
+    # Don't replace a real directory accidentally
+    if latest.is_dir(follow_symlinks=False):
+        raise RuntimeError(f"'latest' exists and is a real directory: {latest}")
 
+    # Build the new link next to the old one and rename it over 'latest', so a
+    # concurrent reader sees either the old or the new bucket, never neither.
+    tmp = root / f".latest.{uuid.uuid4().hex}.tmp"
+    try:
         # Use a relative symlink for portability
-        latest.symlink_to(bucket)
+        tmp.symlink_to(bucket)
+        os.replace(tmp, latest)
     except OSError:
         """Fallback for filesystems that disallow symlinks or
         when permissions are missing."""
+        tmp.unlink(missing_ok=True)
+        # A stale symlink would shadow the marker on resolution.
+        latest.unlink(missing_ok=True)
         (root / "LATEST_BUCKET").write_text(bucket, encoding="utf-8")
 
 
@@ -67,18 +79,17 @@ def resolve_latest_bucket(root: Path) -> Optional[str]:
     Returns:
         The bucket name if resolvable, otherwise None.
     """
-    latest = root / "latest"
-    if latest.is_symlink():
-        try:
-            target = os.readlink(latest)
-            # Normalize and return the terminal path component (the bucket name)
-            return Path(target).name
-        except OSError:
-            # Broken symlink or unreadable; fall through to marker
-            pass
-
-    marker = root / "LATEST_BUCKET"
-    if marker.exists():
-        return marker.read_text(encoding="utf-8").strip() or None
-
-    return None
+    # EAFP: one readlink/read instead of an lstat/exists probe before each.
+    # os.readlink raises OSError both when 'latest' is missing and when it is
+    # not a symlink, so those cases fall through to the marker.
+    try:
+        # Normalize and return the terminal path component (the bucket name)
+        return Path(os.readlink(root / "latest")).name
+    except OSError:
+        # Missing, not a symlink, or unreadable; fall through to marker
+        pass
+
+    try:
+        return (root / "LATEST_BUCKET").read_text(encoding="utf-8").strip() or None
+    except FileNotFoundError:
+        return None
@@ -2,19 +2,35 @@ from __future__ import annotations
 
 import dataclasses as dc
 import hashlib
-import json
 import os
+import shutil
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Callable, Iterable, TypedDict
+from typing import Callable, Iterable, TypedDict, cast
 
 import requests
+from mxm.types import JSONLike
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from mxm.datakraken.common.file_io import read_json, write_json
 
 from .file_index import FirdsFile
 
 UA: str = "mxm-datakraken/0.1 (+https://moneyexmachina.com)"
 DEFAULT_CACHE_DIR: Path = Path.home() / ".mxm" / "cache" / "fca" / "firds"
 MANIFEST_FILE: str = "manifest.json"
+_IO_CHUNK: int = 4 * 1024 * 1024  # download/write buffer size
+DEFAULT_MAX_WORKERS: int = 8
+
+# Serializes manifest read-modify-write when downloads run concurrently.
+_MANIFEST_LOCK = threading.Lock()
+
+# Process-wide session for single-file downloads (keep-alive + TLS reuse).
+_session: requests.Session | None = None
+_SESSION_LOCK = threading.Lock()
 
 
 # ------------------------------
@@ -45,18 +61,38 @@ def _load_cache(cache_dir: Path = DEFAULT_CACHE_DIR) -> CacheInfo:
     cache_dir.mkdir(parents=True, exist_ok=True)
     manifest_path = cache_dir / MANIFEST_FILE
     if manifest_path.exists():
-        with open(manifest_path, "r", encoding="utf-8") as f:
-            manifest: Manifest = json.load(f)
+        manifest: Manifest = cast(Manifest, read_json(manifest_path))
     else:
         manifest = {"files": {}}  # {file_name: metadata}
     return CacheInfo(root=cache_dir, manifest_path=manifest_path, manifest=manifest)
 
 
 def _save_cache(info: CacheInfo) -> None:
-    tmp = info.manifest_path.with_suffix(".tmp")
-    with open(tmp, "w", encoding="utf-8") as f:
-        json.dump(info.manifest, f, indent=2, sort_keys=True)
-    os.replace(tmp, info.manifest_path)
+    # write_json is atomic (temp file + fsync + rename).
+    write_json(info.manifest_path, cast(JSONLike, info.manifest), sort_keys=True)
+
+
+def _new_session(pool_size: int) -> requests.Session:
+    """A session pooling `pool_size` connections per host, with retries."""
+    session = requests.Session()
+    pooled = HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        max_retries=Retry(total=3, backoff_factor=0.3),
+    )
+    session.mount("https://", pooled)
+    session.mount("http://", pooled)
+    session.headers["User-Agent"] = UA
+    return session
+
+
+def _get_session() -> requests.Session:
+    """Return the lazily created, pooled module-level session."""
+    global _session
+    with _SESSION_LOCK:
+        if _session is None:
+            _session = _new_session(DEFAULT_MAX_WORKERS)
+        return _session
 
 
 def _dest_path_for(f: FirdsFile, cache_root: Path) -> Path:
@@ -71,43 +107,45 @@ def is_cached(f: FirdsFile, cache_dir: Path = DEFAULT_CACHE_DIR) -> bool:
     return _dest_path_for(f, cache_dir).exists()
 
 
-def download_and_cache(
+def _download_one(
     f: FirdsFile,
-    cache_dir: Path = DEFAULT_CACHE_DIR,
-    overwrite: bool = False,
-    timeout: int = 120,
-) -> Path:
+    cache_root: Path,
+    *,
+    overwrite: bool,
+    timeout: int,
+    session: requests.Session | None,
+) -> tuple[Path, ManifestFileInfo | None]:
     """
-    Download a FIRDS file and cache it locally.
-    Skips download if already cached (unless overwrite=True).
-    Returns the local path.
+    Download a single file into the cache without touching the manifest.
+    Returns (local_path, manifest_entry); the entry is None on a cache hit.
     """
-    info = _load_cache(cache_dir)
-    dest = _dest_path_for(f, info.root)
+    dest = _dest_path_for(f, cache_root)
 
     if dest.exists() and not overwrite:
-        return dest
+        return dest, None
 
     headers = {"User-Agent": UA}
-    r = requests.get(f.download_link, headers=headers, timeout=timeout, stream=True)
-    r.raise_for_status()
-
+    get = (session or _get_session()).get
     tmp = dest.with_suffix(".part")
-    h = hashlib.sha256()
-    with open(tmp, "wb") as out:
-        for chunk in r.iter_content(chunk_size=1024 * 1024):
-            if not chunk:
-                continue
-            out.write(chunk)
-            h.update(chunk)
+    with get(f.download_link, headers=headers, timeout=timeout, stream=True) as r:
+        r.raise_for_status()
+        # Copy the raw stream in large blocks (shutil.copyfileobj, unbuffered
+        # file) rather than a Python loop over iter_content; decode_content keeps
+        # transfer-encoding (gzip/deflate) handling identical to iter_content.
+        r.raw.decode_content = True
+        with open(tmp, "wb", buffering=0) as out:
+            shutil.copyfileobj(r.raw, out, length=_IO_CHUNK)
+
+    # Hashing happens afterwards in one hashlib.file_digest pass
+    # (OpenSSL's native loop, no per-chunk dispatch).
+    with open(tmp, "rb") as fh:
+        digest = hashlib.file_digest(fh, "sha256").hexdigest()
     os.replace(tmp, dest)
 
-    digest = h.hexdigest()
     with open(dest.with_suffix(".sha256"), "w", encoding="utf-8") as sf:
         sf.write(digest + "\n")
 
-    # Update manifest
-    info.manifest["files"][f.file_name] = {
+    entry: ManifestFileInfo = {
         "file_type": f.file_type,
         "publication_date": f.publication_date,
         "download_link": f.download_link,
@@ -115,7 +153,39 @@ def download_and_cache(
         "sha256": digest,
         "downloaded_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
     }
-    _save_cache(info)
+    return dest, entry
+
+
+def _record_in_manifest(cache_dir: Path, entries: dict[str, ManifestFileInfo]) -> None:
+    """Merge entries into the manifest with a single load + save."""
+    if not entries:
+        return
+    # Reload under the lock so concurrent writers don't lose each other's entries.
+    with _MANIFEST_LOCK:
+        info = _load_cache(cache_dir)
+        info.manifest["files"].update(entries)
+        _save_cache(info)
+
+
+def download_and_cache(
+    f: FirdsFile,
+    cache_dir: Path = DEFAULT_CACHE_DIR,
+    overwrite: bool = False,
+    timeout: int = 120,
+    session: requests.Session | None = None,
+) -> Path:
+    """
+    Download a FIRDS file and cache it locally.
+    Skips download if already cached (unless overwrite=True).
+    Without `session`, a pooled module-level session is reused across calls.
+    Returns the local path.
+    """
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    dest, entry = _download_one(
+        f, cache_dir, overwrite=overwrite, timeout=timeout, session=session
+    )
+    if entry is not None:
+        _record_in_manifest(cache_dir, {f.file_name: entry})
     return dest
 
 
@@ -123,17 +193,58 @@ def download_subset(
     files: Iterable[FirdsFile],
     cache_dir: Path = DEFAULT_CACHE_DIR,
     predicate: Callable[..., FirdsFile] | None = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    session: requests.Session | None = None,
 ) -> list[Path]:
     """
     Download a subset of FIRDS files into cache.
     - files: iterable of FirdsFile objects
     - predicate: optional function(FirdsFile) -> bool to filter which ones to download
-    Returns list of local paths.
+    - max_workers: concurrent downloads (I/O bound; sockets release the GIL)
+    - session: shared by all workers; by default a pooled session with the same
+      retries as `download_and_cache` is opened (and closed) for this call
+    The manifest is loaded and saved once for the whole subset; entries for
+    files that did download are recorded even if another download fails.
+    Returns list of local paths, in input order.
     """
+    selected = [f for f in files if not predicate or predicate(f)]
+    if not selected:
+        return []
+
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    workers = max(1, min(max_workers, len(selected)))
     paths: list[Path] = []
-    for f in files:
-        if predicate and not predicate(f):
-            continue
-        p = download_and_cache(f, cache_dir=cache_dir, overwrite=False)
-        paths.append(p)
+    entries: dict[str, ManifestFileInfo] = {}
+    first_error: BaseException | None = None
+
+    shared = session if session is not None else _new_session(workers)
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            futures = [
+                ex.submit(
+                    _download_one,
+                    f,
+                    cache_dir,
+                    overwrite=False,
+                    timeout=120,
+                    session=shared,
+                )
+                for f in selected
+            ]
+            for f, fut in zip(selected, futures, strict=True):
+                try:
+                    dest, entry = fut.result()
+                except Exception as exc:
+                    first_error = first_error or exc
+                    continue
+                paths.append(dest)
+                if entry is not None:
+                    entries[f.file_name] = entry
+    finally:
+        if session is None:
+            shared.close()
+
+    _record_in_manifest(cache_dir, entries)
+    if first_error is not None:
+        raise first_error
     return paths
@@ -5,16 +5,18 @@ Core helpers for bucket-aware justETF batch orchestration.
 This module keeps the orchestration (`run.py`) thin by factoring out:
 - result typing (`BatchStats`)
 - bucket resolution policy (`resolve_bucket`)
-- quick skip predicate for idempotency (`should_skip`)
+- quick skip predicate for idempotency (`should_skip`, `bucket_existing_isins`)
 - a single-entry processing unit (`process_one_entry`)
 """
 
 from __future__ import annotations
 
+import hashlib
+import os
 from dataclasses import dataclass
 from datetime import date
 from pathlib import Path
-from typing import Callable, Optional, Tuple
+from typing import AbstractSet, Callable, Optional, Tuple, TypeVar
 
 from mxm.config import MXMConfig
 
@@ -24,6 +26,9 @@ from mxm.datakraken.sources.justetf.common.models import (
     JustETFProfile,
 )
 
+# Page body as downloaded and handed to `parse`: decoded HTML or raw bytes.
+PageT = TypeVar("PageT", str, bytes)
+
 # ---------- Result typing ----------
 
 
@@ -38,10 +43,12 @@ class BatchStats:
 
 # ---------- Internal path utility ----------
 
+_PROFILE_FILENAME = "profile.parsed.json"
+
 
 def _bucket_profile_path(base_path: Path, bucket: str, isin: str) -> Path:
     """profiles/<bucket>/<ISIN>/profile.parsed.json"""
-    return base_path / "profiles" / bucket / isin / "profile.parsed.json"
+    return base_path / "profiles" / bucket / isin / _PROFILE_FILENAME
 
 
 # ---------- Policies / Predicates ----------
@@ -82,6 +89,8 @@ def should_skip(
     bucket: Optional[str],
     isin: str,
     force_refresh: bool,
+    verify_hash: bool = False,
+    existing: Optional[AbstractSet[str]] = None,
 ) -> Tuple[bool, Optional[str]]:
     """
     Decide whether to skip downloading/persisting a profile.
@@ -91,15 +100,58 @@ def should_skip(
       - force_refresh is False, AND
       - the bucketed profile file exists.
 
+    With `verify_hash=True` the file must additionally match the SHA-256 recorded
+    in its 'profile.parsed.sha256' sidecar (written by `save_profile`); a
+    mismatch means the file is re-fetched. Files without a sidecar (written
+    before sidecars existed) are trusted as before.
+
+    `existing` (see `bucket_existing_isins`) replaces the per-ISIN stat with a
+    set lookup; it must describe the same `bucket`.
+
     Returns:
       (skip?, reason) where reason is typically "exists" when True.
     """
     if force_refresh or bucket is None:
         return (False, None)
     target = _bucket_profile_path(base_path, bucket, isin)
-    if target.exists():
-        return (True, "exists")
-    return (False, None)
+    if existing is not None:
+        if isin not in existing:
+            return (False, None)
+    elif not target.exists():
+        return (False, None)
+    if verify_hash and not _matches_digest_sidecar(target):
+        return (False, None)
+    return (True, "exists")
+
+
+def bucket_existing_isins(base_path: Path, bucket: str) -> set[str]:
+    """
+    ISINs that already have a parsed profile in `bucket`.
+
+    One directory enumeration of profiles/<bucket>; only ISIN directories that
+    are present get a stat for their 'profile.parsed.json', so ISINs new to the
+    bucket cost nothing. Returns an empty set when the bucket does not exist.
+    """
+    try:
+        with os.scandir(base_path / "profiles" / bucket) as it:
+            return {
+                e.name
+                for e in it
+                if e.is_dir(follow_symlinks=False)
+                and os.path.isfile(os.path.join(e.path, _PROFILE_FILENAME))
+            }
+    except FileNotFoundError:
+        return set()
+
+
+def _matches_digest_sidecar(path: Path) -> bool:
+    """True unless `path` has a '.sha256' sidecar that disagrees with its content."""
+    try:
+        expected = path.with_suffix(".sha256").read_text(encoding="utf-8").strip()
+    except FileNotFoundError:
+        return True
+    with path.open("rb") as fh:
+        return hashlib.file_digest(fh, "sha256").hexdigest() == expected
 
 
 # ---------- Single-entry processing unit ----------
@@ -111,14 +163,14 @@ def process_one_entry(
     base_path: Path,
     entry: ETFProfileIndexEntry,
     bucket: Optional[str],
-    download_html: Callable[[MXMConfig, str, str], Tuple[str, object]],
-    parse: Callable[[str, str], JustETFProfile],
+    download_html: Callable[[MXMConfig, str, str], Tuple[PageT, object]],
+    parse: Callable[[PageT, str], JustETFProfile],
     save: Callable[..., Path],  # expected signature of save_profile(...)
     write_latest: bool,
 ) -> Tuple[str, Optional[JustETFProfile], Optional[str], Optional[str]]:
     """
     Process a single ETF index entry:
-      - download HTML
+      - download HTML (str, or raw bytes for a bytes-aware `parse`)
       - parse to profile
       - choose bucket if None (prefer response.as_of_bucket, else today)
       - persist via save()
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import time
 from datetime import date
 from pathlib import Path
@@ -9,6 +10,7 @@ from mxm.config import MXMConfig
 
 from mxm.datakraken.sources.justetf.batch.core import (
     BatchStats,
+    bucket_existing_isins,
     process_one_entry,
     resolve_bucket,
     should_skip,
@@ -19,8 +21,10 @@ from mxm.datakraken.sources.justetf.common.models import (
     JustETFProfile,
 )
 from mxm.datakraken.sources.justetf.profile_index.api import get_profile_index
-from mxm.datakraken.sources.justetf.profiles.downloader import download_etf_profile_html
-from mxm.datakraken.sources.justetf.profiles.parser import parse_profile
+from mxm.datakraken.sources.justetf.profiles.downloader import (
+    shared_session_fetcher,
+)
+from mxm.datakraken.sources.justetf.profiles.parser import parse_profile_bytes
 from mxm.datakraken.sources.justetf.profiles.persistence import (
     save_profile,
     save_profiles_snapshot,
@@ -35,6 +39,7 @@ def run_batch(
     write_latest: bool = True,
     rate_seconds: float = 2.0,
     force_refresh: bool = False,
+    verify_hash: bool = False,
     run_id: Optional[str] = None,
 ) -> Path:
     """
@@ -56,50 +61,70 @@ def run_batch(
     log = RunLog(base_path=base_path, run_id=run_id)
 
     resolved_bucket: Optional[str] = None
+    # ISINs already persisted in `resolved_bucket` (one scandir once it is known)
+    existing: Optional[set[str]] = None
     ok = skip = err = 0
     run_profiles: list[JustETFProfile] = []
+    # Politeness pacing: `rate_seconds` is the minimum interval between request
+    # starts, so time spent downloading/parsing counts towards the wait.
+    next_request_at = 0.0
 
-    # 3) Process each index entry
-    for entry in entries:
-        isin = entry["isin"]
+    # 3) Process each index entry (one DataIO session shared by the whole batch)
+    # Pages stay bytes from the response file to the parser (no decode pass).
+    with shared_session_fetcher(cfg) as download_html:
+        for entry in entries:
+            isin = entry["isin"]
 
-        # Early skip: only when bucket is known and not forcing
-        do_skip, reason = should_skip(
-            base_path=base_path,
-            bucket=resolved_bucket,
-            isin=isin,
-            force_refresh=force_refresh,
-        )
-        if do_skip:
-            log.log(isin=isin, status="skip", bucket=resolved_bucket, reason=reason)
-            skip += 1
-            continue
-
-        # Download → parse → save (helper returns status + profile/bucket/error)
-        status, profile, bucket_used, error = process_one_entry(
-            cfg=cfg,
-            base_path=base_path,
-            entry=entry,
-            bucket=resolved_bucket,
-            download_html=download_etf_profile_html,
-            parse=parse_profile,
-            save=save_profile,  # persistence helper
-            write_latest=write_latest,
-        )
+            # Early skip: only when bucket is known and not forcing
+            do_skip, reason = should_skip(
+                base_path=base_path,
+                bucket=resolved_bucket,
+                isin=isin,
+                force_refresh=force_refresh,
+                verify_hash=verify_hash,
+                existing=existing,
+            )
+            if do_skip:
+                log.log(isin=isin, status="skip", bucket=resolved_bucket, reason=reason)
+                skip += 1
+                continue
+
+            wait = next_request_at - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+            next_request_at = time.monotonic() + rate_seconds
+
+            # Download → parse → save (helper returns status + profile/bucket/error)
+            status, profile, bucket_used, error = process_one_entry(
+                cfg=cfg,
+                base_path=base_path,
+                entry=entry,
+                bucket=resolved_bucket,
+                download_html=download_html,
+                parse=parse_profile_bytes,
+                # No directory flush per profile. File contents are still
+                # synced before each rename, so a crash can drop the newest
+                # profiles (fetched again next run) but never leaves a
+                # truncated file that should_skip would take as done.
+                save=functools.partial(save_profile, durable=False),
+                write_latest=write_latest,
+            )
 
-        if status == "ok":
-            # Adopt first known bucket if not provided
-            if resolved_bucket is None:
-                resolved_bucket = cast(str, bucket_used)
-            log.log(isin=isin, status="ok", bucket=resolved_bucket)
-            log.mark_ok(isin)
-            run_profiles.append(cast(JustETFProfile, profile))
-            ok += 1
-            time.sleep(rate_seconds)
-        else:  # "err"
-            log.log(isin=isin, status="err", bucket=resolved_bucket, error=error)
-            log.mark_err(isin, {"isin": isin, "error": error})
-            err += 1
+            if status == "ok":
+                # Adopt first known bucket if not provided
+                if resolved_bucket is None:
+                    resolved_bucket = cast(str, bucket_used)
+                    existing = bucket_existing_isins(base_path, resolved_bucket)
+                if existing is not None:
+                    existing.add(isin)
+                log.log(isin=isin, status="ok", bucket=resolved_bucket)
+                log.mark_ok(isin)
+                run_profiles.append(cast(JustETFProfile, profile))
+                ok += 1
+            else:  # "err"
+                log.log(isin=isin, status="err", bucket=resolved_bucket, error=error)
+                log.mark_err(isin, {"isin": isin, "error": error})
+                err += 1
 
     # 4) If still unknown (e.g., all skipped and no bucket passed), resolve now
     if resolved_bucket is None:
@@ -20,27 +20,27 @@ Notes:
 
 from __future__ import annotations
 
-from datetime import datetime, timezone
+import time
 from pathlib import Path
-from typing import Any, Dict, Literal, Optional
+from typing import Any, Dict, Literal, Optional, cast
+
+from mxm.types import JSONLike
+
+from mxm.datakraken.common.file_io import append_jsonl, write_json
 
 Status = Literal["ok", "skip", "err"]
 
 
 def _utc_now_iso() -> str:
     """Return current UTC time in ISO-8601, suffixed with 'Z' (no microseconds)."""
-    return (
-        datetime.now(timezone.utc)
-        .replace(microsecond=0)
-        .isoformat()
-        .replace("+00:00", "Z")
-    )
+    # time.gmtime() avoids building a tz-aware datetime for every log line.
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
 
 
 def _default_run_id() -> str:
     """Deterministic, filesystem-safe default run id (UTC)."""
     # Example: 2025-10-30T07-59-12
-    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H-%M-%S")
+    return time.strftime("%Y-%m-%dT%H-%M-%S", time.gmtime())
 
 
 class RunLog:
@@ -112,10 +112,7 @@ class RunLog:
                     rec[k] = v
 
         # Write one JSON object per line (UTF-8, no ASCII escaping)
-        import json
-
-        with self.progress_path.open("a", encoding="utf-8") as f:
-            f.write(json.dumps(rec, ensure_ascii=False) + "\n")
+        append_jsonl(self.progress_path, cast(JSONLike, rec))
 
     def mark_ok(self, isin: str) -> None:
         """
@@ -131,12 +128,7 @@ class RunLog:
             isin: Security identifier.
             error_json: Arbitrary JSON-serializable dict describing the error.
         """
-        import json
-
-        path = self.err_dir / f"{isin}.json"
-        path.write_text(
-            json.dumps(error_json, ensure_ascii=False, indent=2), encoding="utf-8"
-        )
+        write_json(self.err_dir / f"{isin}.json", cast(JSONLike, error_json))
 
     # ---------- Paths (properties) ----------
 
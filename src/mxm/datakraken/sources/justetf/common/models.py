@@ -14,8 +14,12 @@ Design choices
 - Only the invariants are required (`isin`, `source_url`); everything else is optional
   and may be absent if not present on the page or not yet parsed.
 - Extend these models incrementally as parsers gain coverage; don’t over-specify now.
+- `ProfileIndex` is the list of index entries returned by the loaders; it is a
+  plain list plus a lazily built ISIN lookup.
 """
 
+import sys
+from functools import cached_property
 from typing import NotRequired, Required, TypedDict
 
 
@@ -51,7 +55,21 @@ class ETFProfileIndexEntry(TypedDict):
     lastmod: NotRequired[str]
 
 
+class ProfileIndex(list[ETFProfileIndexEntry]):
+    """
+    List of `ETFProfileIndexEntry` with an ISIN lookup, `by_isin`.
+
+    The mapping is built on first access and then cached; it does not follow
+    later mutations of the list.
+    """
+
+    @cached_property
+    def by_isin(self) -> dict[str, ETFProfileIndexEntry]:
+        return {sys.intern(e["isin"]): e for e in self}
+
+
 __all__ = [
     "JustETFProfile",
     "ETFProfileIndexEntry",
+    "ProfileIndex",
 ]
@@ -13,12 +13,17 @@ from __future__ import annotations
 
 from datetime import date
 from pathlib import Path
+from typing import Callable
 
 from mxm.config import MXMConfig
+from mxm.dataio.models import Response as IoResponse
 
+from mxm.datakraken.sources.justetf.common.models import (
+    ETFProfileIndexEntry,
+    ProfileIndex,
+)
 from mxm.datakraken.sources.justetf.profile_index.discover import (
     SITEMAP_URL,
-    ETFProfileIndexEntry,
     build_profile_index,
 )
 from mxm.datakraken.sources.justetf.profile_index.persistence import (
@@ -34,14 +39,23 @@ def get_profile_index(
     as_of_bucket: str | None = None,
     force_refresh: bool = False,
     sitemap_url: str = SITEMAP_URL,
-) -> list[ETFProfileIndexEntry]:
+    build: Callable[
+        ..., tuple[list[ETFProfileIndexEntry], IoResponse]
+    ] = build_profile_index,
+) -> ProfileIndex:
     """
     Return the ETF profile index using bucketed storage.
 
+    The result is a `ProfileIndex`: a list of entries that also offers an ISIN
+    lookup (`by_isin`), built on first use.
+
     Bucket resolution:
       - For reads: use `as_of_bucket` if provided; otherwise default to 'latest'.
       - For refresh: prefer provenance.as_of_bucket; else `as_of_bucket`;
       else today's date.
+
+    `build` fetches and parses the sitemap (`build_profile_index` signature);
+    tests inject a stand-in here rather than patching the module.
     """
     if not force_refresh:
         try:
@@ -51,7 +65,7 @@ def get_profile_index(
             pass
 
     # Build fresh via HTTP + DataIO
-    entries, resp = build_profile_index(cfg, sitemap_url=sitemap_url)
+    entries, resp = build(cfg, sitemap_url=sitemap_url, base_path=base_path)
 
     # Decide target bucket for write
     bucket = (
@@ -67,4 +81,4 @@ def get_profile_index(
         write_latest=True,
     )
 
-    return entries
+    return ProfileIndex(entries)
@@ -4,16 +4,18 @@ Persistence helpers for the ETF Profile Index.
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
 from typing import List, cast
 
 from mxm.dataio.models import Response as IoResponse
-from mxm.types import JSONLike
+from mxm.types import JSONLike, JSONObj
 
-from mxm.datakraken.common.file_io import read_json, write_json
+from mxm.datakraken.common.file_io import fsync_dir, read_json, write_json
 from mxm.datakraken.common.latest_bucket import resolve_latest_bucket
-from mxm.datakraken.sources.justetf.profile_index.discover import (
+from mxm.datakraken.sources.justetf.common.models import (
     ETFProfileIndexEntry,
+    ProfileIndex,
 )
 
 
@@ -22,6 +24,7 @@ def _write_index_provenance(
     *,
     bucket: str,
     resp: IoResponse,
+    sync_dir: bool = True,
 ) -> Path:
     """Write the bucketed provenance sidecar for the profile index.
 
@@ -33,6 +36,8 @@ def _write_index_provenance(
         bucket_dir: The resolved '<pi_root>/<bucket>' directory (already created).
         bucket: The as_of_bucket identifier.
         resp: The DataIO Response returned from the sitemap fetch.
+        sync_dir: Forwarded to `write_json`; False leaves the fsync of
+            `bucket_dir` to the caller.
 
     Returns: Path to the written sidecar JSON.
     """
@@ -56,7 +61,12 @@ def _write_index_provenance(
             "cache_tag": getattr(resp, "cache_tag", None),
         },
     }
-    return write_json(bucket_dir / "profile_index.response.json", sidecar)
+    return write_json(
+        bucket_dir / "profile_index.response.json",
+        sidecar,
+        sync_dir=sync_dir,
+        skip_unchanged=True,
+    )
 
 
 def save_profile_index(
@@ -67,7 +77,13 @@ def save_profile_index(
     as_of_bucket: str | None = None,
     write_latest: bool = True,
 ) -> Path:
-    """Persist the profile index snapshot and (optionally) its provenance sidecar."""
+    """Persist the profile index snapshot and (optionally) its provenance sidecar.
+
+    Files whose content is unchanged (e.g. a re-run against the same sitemap)
+    are left untouched, so their mtimes stay valid for downstream caches.
+    Each file is fsync'ed before it is renamed into place; the bucket directory
+    itself is fsync'ed once, after all of them.
+    """
     from mxm.datakraken.common.latest_bucket import update_latest_pointer
 
     if provenance is None and not as_of_bucket:
@@ -81,24 +97,74 @@ def save_profile_index(
     bucket_dir.mkdir(parents=True, exist_ok=True)
 
     parsed_path = bucket_dir / "profile_index.parsed.json"
-    write_json(parsed_path, cast(JSONLike, entries))
+    write_json(
+        parsed_path, cast(JSONLike, entries), sync_dir=False, skip_unchanged=True
+    )
 
     if provenance is not None:
         _write_index_provenance(
             bucket_dir=bucket_dir,
             bucket=bucket,
             resp=provenance,
+            sync_dir=False,
         )
+    fsync_dir(bucket_dir)
     if write_latest:
         update_latest_pointer(pi_root, bucket)
     return parsed_path
 
 
+def load_profile_index_for_response(
+    base_path: Path,
+    resp: IoResponse,
+) -> List[ETFProfileIndexEntry] | None:
+    """
+    Return the persisted index of `resp`'s bucket if it was built from the same
+    sitemap payload, else None.
+
+    "Same" means the bucket's provenance sidecar records the same `checksum`
+    and `cache_tag` as `resp`. Missing or unreadable files also yield None.
+    """
+    bucket = getattr(resp, "as_of_bucket", None)
+    checksum = getattr(resp, "checksum", None)
+    if not bucket or not checksum:
+        return None
+
+    bucket_dir = base_path / "profile_index" / bucket
+    try:
+        sidecar = cast(JSONObj, read_json(bucket_dir / "profile_index.response.json"))
+        recorded = cast(JSONObj, sidecar["response"])
+        if recorded.get("checksum") != checksum:
+            return None
+        if recorded.get("cache_tag") != getattr(resp, "cache_tag", None):
+            return None
+        parsed = read_json(bucket_dir / "profile_index.parsed.json")
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        return None
+    return cast(List[ETFProfileIndexEntry], parsed)
+
+
+def _last_bucket(pi_root: Path) -> str | None:
+    """
+    Lexicographically last bucket directory under `pi_root`, or None.
+
+    Bucket names are ISO dates, so one max() over a single scandir pass
+    suffices (no sort, and DirEntry.is_dir answers from the listing without a
+    stat per bucket). Not cached: the listing is cheap, and a directory mtime
+    is too coarse a key to notice every new or replaced bucket.
+    """
+    with os.scandir(pi_root) as it:
+        return max(
+            (e.name for e in it if e.name != "latest" and e.is_dir()),
+            default=None,
+        )
+
+
 def load_profile_index(
     base_path: Path,
     *,
     as_of_bucket: str | None = None,
-) -> List[ETFProfileIndexEntry]:
+) -> ProfileIndex:
     """
     Load the ETF Profile Index from the bucketed layout.
 
@@ -108,31 +174,31 @@ def load_profile_index(
       2) Else, try the 'latest' pointer (symlink or LATEST_BUCKET)
       3) Else, fall back to the lexicographically last bucket directory
 
+    Returns a `ProfileIndex` (a list of entries with a `by_isin` lookup).
+
     Raises:
       FileNotFoundError if nothing suitable is found.
     """
     pi_root = base_path / "profile_index"
-    if not pi_root.exists():
-        raise FileNotFoundError(f"Profile index directory not found: {pi_root}")
 
+    # No exists() probes up front: the pointer lookup, the fallback listing and
+    # the final read each fail with FileNotFoundError on their own.
     bucket = as_of_bucket or resolve_latest_bucket(pi_root)
     if bucket is None:
         # fallback: pick lexicographically last bucket dir
-        buckets = sorted(
-            [
-                p.name
-                for p in pi_root.iterdir()
-                if p.is_dir() and p.name not in {"latest"}
-            ]
-        )
-        if not buckets:
+        try:
+            bucket = _last_bucket(pi_root)
+        except FileNotFoundError:
+            raise FileNotFoundError(
+                f"Profile index directory not found: {pi_root}"
+            ) from None
+        if bucket is None:
             raise FileNotFoundError("No profile index buckets found.")
-        bucket = buckets[-1]
 
     parsed_path = pi_root / bucket / "profile_index.parsed.json"
-    if not parsed_path.exists():
+    try:
+        return ProfileIndex(cast(List[ETFProfileIndexEntry], read_json(parsed_path)))
+    except FileNotFoundError:
         raise FileNotFoundError(
             f"Parsed index not found for bucket '{bucket}': {parsed_path}"
-        )
-
-    return cast(List[ETFProfileIndexEntry], read_json(parsed_path))
+        ) from None
@@ -2,14 +2,22 @@
 Downloader for justETF profiles (DataIO-backed).
 
 This module fetches the raw HTML of a justETF profile page via mxm-dataio.
+
+- `download_etf_profile_html(cfg, ...)` opens a session per call (single use).
+- `fetch_etf_profile_html(io, ...)` reuses an already-open session;
+  `fetch_etf_profile_bytes` is the same without decoding the body.
+- `shared_session_fetcher(cfg)` yields a callable returning undecoded bodies
+  that opens one session lazily and reuses it for a whole batch.
 """
 
 from __future__ import annotations
 
+from contextlib import ExitStack, contextmanager
 from pathlib import Path
-from typing import cast
+from typing import Callable, Generator, Optional, cast
 
 from mxm.config import MXMConfig
+from mxm.dataio.api import DataIoSession
 from mxm.dataio.models import Response as IoResponse
 from mxm.types import JSONObj
 
@@ -26,14 +34,15 @@ def _response_bytes(resp: IoResponse) -> bytes:
     return data
 
 
-def download_etf_profile_html(
-    cfg: MXMConfig,
+def fetch_etf_profile_bytes(
+    io: DataIoSession,
     isin: str,
     url: str,
     timeout: float | int = 30,
-) -> tuple[str, IoResponse]:
+) -> tuple[bytes, IoResponse]:
     """
-    Fetch a justETF profile page via mxm-dataio and return (HTML, Response).
+    Fetch a justETF profile page through an open DataIO session and return
+    (raw body, Response), leaving decoding to the caller.
     """
     _ = isin  # reserved for logging/debug
     params = cast(
@@ -45,7 +54,55 @@ def download_etf_profile_html(
             "timeout": float(timeout),
         },
     )
+    resp = io.fetch(io.request(kind="profile_html", params=params))
+    return _response_bytes(resp), resp
+
+
+def fetch_etf_profile_html(
+    io: DataIoSession,
+    isin: str,
+    url: str,
+    timeout: float | int = 30,
+) -> tuple[str, IoResponse]:
+    """
+    Fetch a justETF profile page through an open DataIO session and return
+    (HTML, Response).
+    """
+    data, resp = fetch_etf_profile_bytes(io, isin, url, timeout)
+    return data.decode("utf-8", errors="replace"), resp
+
+
+def download_etf_profile_html(
+    cfg: MXMConfig,
+    isin: str,
+    url: str,
+    timeout: float | int = 30,
+) -> tuple[str, IoResponse]:
+    """
+    Fetch a justETF profile page via mxm-dataio and return (HTML, Response).
+    """
     with open_justetf_session(cfg) as io:
-        resp = io.fetch(io.request(kind="profile_html", params=params))
-        html = _response_bytes(resp).decode("utf-8", errors="replace")
-        return html, resp
+        return fetch_etf_profile_html(io, isin, url, timeout)
+
+
+@contextmanager
+def shared_session_fetcher(
+    cfg: MXMConfig,
+) -> Generator[Callable[[MXMConfig, str, str], tuple[bytes, IoResponse]]]:
+    """
+    Yield a `fetch(cfg, isin, url)` callable returning undecoded page bodies,
+    backed by a single DataIO session opened on first use and closed on exit.
+
+    Opening lazily keeps batches that end up skipping every entry free of any
+    session/policy bootstrap.
+    """
+    with ExitStack() as stack:
+        io: Optional[DataIoSession] = None
+
+        def _fetch(_cfg: MXMConfig, isin: str, url: str) -> tuple[bytes, IoResponse]:
+            nonlocal io
+            if io is None:
+                io = stack.enter_context(open_justetf_session(cfg))
+            return fetch_etf_profile_bytes(io, isin, url)
+
+        yield _fetch
@@ -0,0 +1,218 @@
+"""
+lxml/XPath extractors for JustETF profile pages.
+
+Same helpers as `parser` (`extract_name`, `extract_description`,
+`extract_data_table`, `extract_listings`), but operating on an lxml element
+tree with XPath queries compiled once at import. No bs4 wrapper objects are
+created, so this is the fast path `parse_profile` takes (via
+`extract_profile_fields`) when lxml (``speedups`` extra) is installed; importing
+this module raises ImportError otherwise.
+
+Text extraction mirrors bs4's ``get_text``: comments and the contents of
+<script>, <style> and <template> are skipped, and with ``strip`` each text node
+is stripped and empty ones are dropped.
+"""
+
+from __future__ import annotations
+
+import re
+import sys
+import threading
+from typing import Iterator, cast
+
+from lxml import etree
+from lxml.etree import _Element  # pyright: ignore[reportPrivateUsage]
+
+# Substrings every page carrying the section must contain. Layouts without a
+# section skip its extractor; a false positive only costs the usual lookup.
+_DESCRIPTION_MARKER = "etf-description-content"
+_DATA_TABLE_MARKER = "etf-data-table"
+_LISTINGS_MARKERS: tuple[str, ...] = ("stock-exchange", "mobile-table")
+
+_NON_TEXT_TAGS: frozenset[str] = frozenset({"script", "style", "template"})
+_VALUE_CLASSES: tuple[str, ...] = ("val", "val2")
+_WS_RE: re.Pattern[str] = re.compile(r"\s+")
+_SPACE_BEFORE_PUNCT_RE: re.Pattern[str] = re.compile(r"\s+([.,;:])")
+
+
+def _has_class(cls: str) -> str:
+    """XPath predicate: the element's class list contains `cls`."""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {cls} ')"
+
+
+_FIRST_H1 = etree.XPath("(//h1)[1]")
+_DESCRIPTION = etree.XPath("(//div[@id='etf-description-content'])[1]")
+_DATA_TABLE = etree.XPath(f"(//table[{_has_class('etf-data-table')}])[1]")
+_STOCK_ANCHOR = etree.XPath("(//div[@id='stock-exchange'])[1]")
+# bs4's find_next also looks inside the anchor, hence descendant | following.
+_LISTINGS_TABLE = etree.XPath(
+    f"(descendant::table[{_has_class('mobile-table')}]"
+    f" | following::table[{_has_class('mobile-table')}])[1]"
+)
+
+# Decode exactly as given: the page text is already a str, so any <meta charset>
+# must not override it. Parsers are not shared between threads.
+_parsers = threading.local()
+
+
+def _parser() -> etree.HTMLParser:
+    parser = cast(etree.HTMLParser | None, getattr(_parsers, "parser", None))
+    if parser is None:
+        parser = etree.HTMLParser(encoding="utf-8")
+        _parsers.parser = parser
+    return parser
+
+
+def parse_document(html: str | bytes) -> _Element:
+    """
+    Parse a profile page into an lxml tree (an empty page yields <html/>).
+
+    Bytes are taken as UTF-8 and handed to libxml2 without a copy.
+    """
+    data = html.encode("utf-8") if isinstance(html, str) else html
+    root = cast(_Element | None, etree.HTML(data, _parser()))
+    return root if root is not None else etree.Element("html")
+
+
+def extract_profile_fields(
+    html: str | bytes,
+) -> tuple[str, str, dict[str, str], list[dict[str, str]]]:
+    """
+    Parse `html` and return ``(name, description, data, listings)``.
+
+    Extractors whose section marker does not occur in the page are skipped.
+    """
+    if isinstance(html, str):
+        text = html
+
+        def has_marker(marker: str) -> bool:
+            return marker in text
+
+    else:
+        raw = html
+
+        def has_marker(marker: str) -> bool:
+            return marker.encode() in raw
+
+    root = parse_document(html)
+    description = extract_description(root) if has_marker(_DESCRIPTION_MARKER) else ""
+    data = extract_data_table(root) if has_marker(_DATA_TABLE_MARKER) else {}
+    listings = (
+        extract_listings(root)
+        if all(has_marker(marker) for marker in _LISTINGS_MARKERS)
+        else []
+    )
+    return extract_name(root), description, data, listings
+
+
+def _first(query: etree.XPath, node: _Element) -> _Element | None:
+    found = cast(list[_Element], query(node))
+    return found[0] if found else None
+
+
+def _strings(el: _Element) -> Iterator[str]:
+    """Text nodes of `el` in document order, as bs4 would yield them."""
+    if el.text:
+        yield el.text
+    for child in el:
+        # Comments and PIs have a callable tag (the stubs say str).
+        tag = child.tag
+        if (
+            isinstance(tag, str)  # pyright: ignore[reportUnnecessaryIsInstance]
+            and tag not in _NON_TEXT_TAGS
+        ):
+            yield from _strings(child)
+        if child.tail:
+            yield child.tail
+
+
+def _text(el: _Element, separator: str = "") -> str:
+    """Equivalent of bs4 ``get_text(separator, strip=True)``."""
+    return separator.join(s for s in (t.strip() for t in _strings(el)) if s)
+
+
+def _classes(el: _Element) -> list[str]:
+    return el.get("class", "").split()
+
+
+def _child_tags(parent: _Element, name: str) -> list[_Element]:
+    return [c for c in parent if c.tag == name]
+
+
+def extract_name(root: _Element) -> str:
+    """Extract the ETF name from the first <h1> header."""
+    name_el = _first(_FIRST_H1, root)
+    return _text(name_el) if name_el is not None else ""
+
+
+def extract_description(root: _Element) -> str:
+    """Extract the cleaned fund description (see `parser.extract_description`)."""
+    container = _first(_DESCRIPTION, root)
+    if container is None:
+        return ""
+    parts = [_text(child, " ") for child in _child_tags(container, "div")]
+    cleaned = _WS_RE.sub(" ", " ".join(p for p in parts if p))
+    return _SPACE_BEFORE_PUNCT_RE.sub(r"\1", cleaned).strip()
+
+
+def extract_data_table(root: _Element) -> dict[str, str]:
+    """Extract key-value pairs from the ETF data table."""
+    data: dict[str, str] = {}
+
+    table = _first(_DATA_TABLE, root)
+    if table is None:
+        return data
+
+    for row in table.iter("tr"):
+        cells = list(row.iter("td"))
+        label_cell = next((td for td in cells if "vallabel" in _classes(td)), None)
+        if label_cell is None or len(cells) < 2:
+            continue
+        value_cell = cells[1]
+
+        by_class: dict[str, list[str]] = {cls: [] for cls in _VALUE_CLASSES}
+        # Elements only: comments and PIs have no attributes to read classes from.
+        for el in value_cell.iterdescendants(tag=etree.Element):
+            el_classes = _classes(el)
+            for cls in _VALUE_CLASSES:
+                if cls in el_classes:
+                    by_class[cls].append(_text(el, " "))
+        vals = [v for cls in _VALUE_CLASSES for v in by_class[cls]]
+        if not vals:
+            vals.append(_text(value_cell, " "))
+
+        key = sys.intern(_text(label_cell, " "))
+        data[key] = " ".join(v for v in vals if v)
+
+    return data
+
+
+def extract_listings(root: _Element) -> list[dict[str, str]]:
+    """Extract ETF listings from the table following div#stock-exchange."""
+    listings: list[dict[str, str]] = []
+
+    anchor = _first(_STOCK_ANCHOR, root)
+    if anchor is None:
+        return listings
+    table = _first(_LISTINGS_TABLE, anchor)
+    if table is None:
+        return listings
+
+    # Every thead and tbody, as with the selectors "thead th" / "tbody tr".
+    th_tags = [th for thead in table.iter("thead") for th in thead.iter("th")]
+    headers = [sys.intern(_text(th).replace("\xa0", " ").strip()) for th in th_tags]
+
+    # Pre-sized row template (see `parser._listings_from`).
+    template = dict.fromkeys(headers, "")
+
+    for tbody in table.iter("tbody"):
+        for tr in tbody.iter("tr"):
+            cells = [_text(td) for td in tr.iter("td")]
+            if len(cells) != len(headers):
+                # Sometimes rowspan/colspan causes mismatch — skip partial rows
+                continue
+            row = template.copy()
+            row.update(zip(headers, cells, strict=False))
+            listings.append(row)
+
+    return listings
@@ -6,21 +6,98 @@ JustETFProfile structure faithful to the JustETF site’s layout.
 
 Helpers (`extract_name`, `extract_description`, `extract_data_table`,
 `extract_listings`) are factored out for granular testing.
+`parse_profile_bytes` takes the raw UTF-8 response body, which the lxml path
+parses without decoding it to a str first.
+
+When lxml is installed (``speedups`` extra), `parse_profile` skips bs4 and runs
+the XPath equivalents of these helpers from `lxml_parser` on an lxml tree.
+Otherwise pages are parsed with bs4's pure-Python ``html.parser``. Results agree
+on well-formed markup; on broken markup the two parsers may repair tags
+slightly differently.
 """
 
 from __future__ import annotations
 
+import codecs
 import re
+import sys
+import threading
 from datetime import datetime, timezone
-from typing import cast
+from typing import Mapping, cast
 
 from bs4 import BeautifulSoup, Tag
+from bs4.builder import TreeBuilder, builder_registry
+from bs4.filter import SoupStrainer
 
 from mxm.datakraken.sources.justetf.common.models import JustETFProfile
 
+try:
+    from mxm.datakraken.sources.justetf.profiles import lxml_parser
+except ImportError:  # pragma: no cover - exercised only without the extra
+    lxml_parser = None
+
+# With lxml installed pages go through `lxml_parser` and never reach bs4; only
+# the html.parser fallback builds a soup.
+_HTML_PARSER: str = "lxml" if lxml_parser is not None else "html.parser"
+
+# The html.parser tree builder is reused across parse_profile calls. A builder
+# holds the soup it is currently filling, so each thread gets its own.
+_builders = threading.local()
+
+# Page sections the extractors read (see `_ProfileSections`).
+_KEPT_DIV_IDS: frozenset[str] = frozenset({"etf-description-content", "stock-exchange"})
+_KEPT_TABLE_CLASSES: frozenset[str] = frozenset({"etf-data-table", "mobile-table"})
+
+
+class _ProfileSections(SoupStrainer):
+    """
+    Build only the sub-trees the extractors read (``parse_only`` filter).
+
+    Kept: every <h1>, div#etf-description-content, div#stock-exchange and
+    table.etf-data-table / table.mobile-table, each with its full subtree.
+    Everything else is tokenized but never turned into Tag objects. Document
+    order is preserved, so `find_next` from the stock-exchange anchor still
+    reaches the same listings table.
+    """
+
+    def allow_tag_creation(
+        self, nsprefix: str | None, name: str, attrs: Mapping[str, str] | None
+    ) -> bool:
+        _ = nsprefix
+        if name == "h1":
+            return True
+        if not attrs:
+            return False
+        if name == "div":
+            return attrs.get("id") in _KEPT_DIV_IDS
+        if name == "table":
+            return not _KEPT_TABLE_CLASSES.isdisjoint(attrs.get("class", "").split())
+        return False
+
+
+_PROFILE_SECTIONS = _ProfileSections()
+
+_WS_RE: re.Pattern[str] = re.compile(r"\s+")
+_SPACE_BEFORE_PUNCT_RE: re.Pattern[str] = re.compile(r"\s+([.,;:])")
+
+def _tree_builder() -> TreeBuilder:
+    """Return this thread's cached html.parser tree builder."""
+    builder = cast(TreeBuilder | None, getattr(_builders, "html_parser", None))
+    if builder is None:
+        builder_cls = builder_registry.lookup("html.parser")
+        if builder_cls is None:
+            raise ValueError("No bs4 tree builder registered for 'html.parser'")
+        builder = builder_cls()
+        _builders.html_parser = builder
+    return builder
+
 
 def parse_profile(
-    html: str, isin: str, source_url: str | None = None
+    html: str,
+    isin: str,
+    source_url: str | None = None,
+    *,
+    last_fetched: str | None = None,
 ) -> JustETFProfile:
     """
     Parse a JustETF profile HTML page into a structured dict.
@@ -29,16 +106,26 @@ def parse_profile(
         html: Raw HTML of the ETF profile page.
         isin: ISIN of the ETF (from sitemap / index).
         source_url: Optional canonical profile URL (for provenance).
+        last_fetched: ISO timestamp to record; defaults to the current UTC time.
 
     Returns:
         A JustETFProfile dictionary with parsed fields.
     """
-    soup: BeautifulSoup = BeautifulSoup(html, "html.parser")
-
-    name: str = extract_name(soup)
-    description: str = extract_description(soup)
-    data: dict[str, str] = extract_data_table(soup)
-    listings: list[dict[str, str]] = extract_listings(soup)
+    name: str
+    description: str
+    data: dict[str, str]
+    listings: list[dict[str, str]]
+    if lxml_parser is not None and _HTML_PARSER == "lxml":
+        name, description, data, listings = lxml_parser.extract_profile_fields(html)
+    else:
+        soup: BeautifulSoup = BeautifulSoup(
+            html, builder=_tree_builder(), parse_only=_PROFILE_SECTIONS
+        )
+        name_el, desc_el, data_el, listings_el = _locate_sections(soup)
+        name = _name_from(name_el)
+        description = _description_from(desc_el)
+        data = _data_table_from(data_el)
+        listings = _listings_from(listings_el)
 
     profile: JustETFProfile = {
         "isin": isin,
@@ -47,19 +134,109 @@ def parse_profile(
         "data": data,
         "listings": listings,
         "source_url": source_url or "",
-        "last_fetched": datetime.now(timezone.utc).isoformat(),
+        "last_fetched": last_fetched or datetime.now(timezone.utc).isoformat(),
     }
     return profile
 
 
+def parse_profile_bytes(
+    html: bytes,
+    isin: str,
+    source_url: str | None = None,
+    *,
+    last_fetched: str | None = None,
+    encoding: str = "utf-8",
+) -> JustETFProfile:
+    """
+    Like `parse_profile`, but from the undecoded page body.
+
+    On the lxml path UTF-8 bytes go straight to libxml2 (invalid sequences
+    become U+FFFD, as with ``errors="replace"``), skipping the decode to str and
+    lxml's re-encode. Other encodings, or the bs4 fallback, decode and defer to
+    `parse_profile`.
+    """
+    if (
+        lxml_parser is None
+        or _HTML_PARSER != "lxml"
+        or codecs.lookup(encoding).name != "utf-8"
+    ):
+        return parse_profile(
+            html.decode(encoding, errors="replace"),
+            isin,
+            source_url,
+            last_fetched=last_fetched,
+        )
+
+    name, description, data, listings = lxml_parser.extract_profile_fields(html)
+    return {
+        "isin": isin,
+        "name": name,
+        "description": description,
+        "data": data,
+        "listings": listings,
+        "source_url": source_url or "",
+        "last_fetched": last_fetched or datetime.now(timezone.utc).isoformat(),
+    }
+
+
 # ----------------------------------------------------------------------
 # Helpers
 # ----------------------------------------------------------------------
 
 
+def _locate_sections(
+    soup: BeautifulSoup,
+) -> tuple[Tag | None, Tag | None, Tag | None, Tag | None]:
+    """
+    Find, in one walk over the tree, what the four extractors start from.
+
+    Returns ``(h1, description div, data table, listings table)``, each the same
+    element the public `extract_*` helper would find on its own: the first
+    match in document order, and for listings the first ``table.mobile-table``
+    at or after ``div#stock-exchange``. The walk stops once all four are found.
+    """
+    name_el: Tag | None = None
+    desc_el: Tag | None = None
+    data_el: Tag | None = None
+    anchor: Tag | None = None
+    listings_el: Tag | None = None
+
+    for el in soup.descendants:
+        if not isinstance(el, Tag):
+            continue
+        if el.name == "h1":
+            if name_el is None:
+                name_el = el
+        elif el.name == "div":
+            el_id = el.get("id")
+            if el_id == "etf-description-content" and desc_el is None:
+                desc_el = el
+            elif el_id == "stock-exchange" and anchor is None:
+                anchor = el
+        elif el.name == "table":
+            el_classes = _classes(el)
+            if data_el is None and "etf-data-table" in el_classes:
+                data_el = el
+            if anchor is not None and listings_el is None:
+                if "mobile-table" in el_classes:
+                    listings_el = el
+        if (
+            name_el is not None
+            and desc_el is not None
+            and data_el is not None
+            and listings_el is not None
+        ):
+            break
+
+    return name_el, desc_el, data_el, listings_el
+
+
 def extract_name(soup: BeautifulSoup) -> str:
     """Extract the ETF name from the <h1> header."""
-    name_el: Tag | None = soup.find("h1")
+    return _name_from(soup.find("h1"))
+
+
+def _name_from(name_el: Tag | None) -> str:
     return name_el.get_text(strip=True) if name_el else ""
 
 
@@ -73,7 +250,10 @@ def extract_description(soup: BeautifulSoup) -> str:
     Returns:
         A cleaned string containing the description.
     """
-    desc_container: Tag | None = soup.find("div", id="etf-description-content")
+    return _description_from(soup.find("div", id="etf-description-content"))
+
+
+def _description_from(desc_container: Tag | None) -> str:
     if not desc_container:
         return ""
 
@@ -88,45 +268,62 @@ def extract_description(soup: BeautifulSoup) -> str:
     raw: str = " ".join(parts)
 
     # Normalize whitespace
-    cleaned: str = re.sub(r"\s+", " ", raw)
+    cleaned: str = _WS_RE.sub(" ", raw)
 
     # Remove spaces before punctuation like ". , ; :"
-    cleaned = re.sub(r"\s+([.,;:])", r"\1", cleaned)
+    cleaned = _SPACE_BEFORE_PUNCT_RE.sub(r"\1", cleaned)
 
     return cleaned.strip()
 
 
+_VALUE_CLASSES: tuple[str, ...] = ("val", "val2")
+
+
+def _classes(el: Tag) -> list[str]:
+    """CSS classes of `el` (bs4 parses `class` as a multi-valued attribute)."""
+    return cast(list[str], el.get("class") or [])
+
+
 def extract_data_table(soup: BeautifulSoup) -> dict[str, str]:
     """
     Extract key-value pairs from the ETF data table.
     Keys are in <td class="vallabel">, values in <td>/<div>/<span> with
     class val/val2 or plain text.
     """
-    data: dict[str, str] = {}
+    return _data_table_from(soup.find("table", class_="etf-data-table"))
+
 
-    table: Tag | None = soup.find("table", class_="etf-data-table")
+def _data_table_from(table: Tag | None) -> dict[str, str]:
+    data: dict[str, str] = {}
     if not table:
         return data
 
     for row in cast(list[Tag], table.find_all("tr")):
-        label_cell: Tag | None = row.find("td", class_="vallabel")
-        value_cell: Tag | None = None
-
-        if label_cell:
-            siblings: list[Tag] = cast(list[Tag], row.find_all("td"))
-            if len(siblings) > 1:
-                value_cell = siblings[1]
-
-        if not label_cell or not value_cell:
+        # One traversal per row: the label is the first "vallabel" cell and
+        # the value is the second cell of the row.
+        cells: list[Tag] = cast(list[Tag], row.find_all("td"))
+        label_cell: Tag | None = next(
+            (td for td in cells if "vallabel" in _classes(td)), None
+        )
+        if not label_cell or len(cells) < 2:
             continue
+        value_cell: Tag = cells[1]
 
-        key: str = label_cell.get_text(" ", strip=True)
+        # Labels ("TER", "Fund size", ...) recur on every page: intern them so
+        # all profiles share one key object.
+        key: str = sys.intern(label_cell.get_text(" ", strip=True))
 
         # values may be nested in <div class="val">, <span class="val2">, etc.
-        vals: list[str] = []
-        for cls in ["val", "val2"]:
-            for el in cast(list[Tag], value_cell.find_all(class_=cls)):
-                vals.append(el.get_text(" ", strip=True))
+        # One walk over the value cell; "val" texts still precede "val2" texts.
+        by_class: dict[str, list[str]] = {cls: [] for cls in _VALUE_CLASSES}
+        for el in value_cell.descendants:
+            if not isinstance(el, Tag):
+                continue
+            el_classes = _classes(el)
+            for cls in _VALUE_CLASSES:
+                if cls in el_classes:
+                    by_class[cls].append(el.get_text(" ", strip=True))
+        vals: list[str] = [v for cls in _VALUE_CLASSES for v in by_class[cls]]
 
         # fallback: if no val/val2, take raw text
         if not vals:
@@ -145,32 +342,50 @@ def extract_listings(soup: BeautifulSoup) -> list[dict[str, str]]:
     Extract ETF listings from the 'Stock exchange' section.
     Robust against other mobile-table uses (e.g. dividends).
     """
-    listings: list[dict[str, str]] = []
-
     # 1️⃣Find the section anchored by id="stock-exchange"
     stock_anchor: Tag | None = soup.select_one("div#stock-exchange")
     if not stock_anchor:
-        return listings
+        return []
 
     # 2️⃣Find the nearest following table after the anchor
-    table: Tag | None = stock_anchor.find_next("table", class_="mobile-table")
+    return _listings_from(stock_anchor.find_next("table", class_="mobile-table"))
+
+
+def _listings_from(table: Tag | None) -> list[dict[str, str]]:
+    listings: list[dict[str, str]] = []
     if not table:
         return listings
 
     # 3️⃣Extract headers
-    th_tags: list[Tag] = cast(list[Tag], table.select("thead th"))
+    # Same matches as the selectors "thead th" / "tbody tr" / "td", across every
+    # thead and tbody, without going through soupsieve.
+    th_tags: list[Tag] = [
+        th
+        for thead in cast(list[Tag], table.find_all("thead"))
+        for th in cast(list[Tag], thead.find_all("th"))
+    ]
     headers: list[str] = [th.get_text(strip=True) for th in th_tags]
     # Normalize: collapse duplicate spaces and unify capitalization
-    headers = [h.replace("\xa0", " ").strip() for h in headers]
+    headers = [sys.intern(h.replace("\xa0", " ").strip()) for h in headers]
+
+    # Every row has the same keys: copying a pre-sized template and filling it
+    # in beats building a fresh dict per row.
+    template: dict[str, str] = dict.fromkeys(headers, "")
 
     # 4️⃣Extract rows
-    for tr in cast(list[Tag], table.select("tbody tr")):
-        td_tags: list[Tag] = cast(list[Tag], tr.select("td"))
+    body_rows: list[Tag] = [
+        tr
+        for tbody in cast(list[Tag], table.find_all("tbody"))
+        for tr in cast(list[Tag], tbody.find_all("tr"))
+    ]
+    for tr in body_rows:
+        td_tags: list[Tag] = cast(list[Tag], tr.find_all("td"))
         cells: list[str] = [td.get_text(strip=True) for td in td_tags]
         if len(cells) != len(headers):
             # Sometimes rowspan/colspan causes mismatch — skip partial rows
             continue
-        row: dict[str, str] = dict(zip(headers, cells, strict=False))
+        row = template.copy()
+        row.update(zip(headers, cells, strict=False))
         listings.append(row)
 
     return listings
@@ -6,9 +6,9 @@ Layout (per as_of_bucket):
         ├─ <as_of_bucket>/                     # e.g., "2025-10-30"
         │   ├─ <ISIN>/
         │   │   ├─ profile.parsed.json
+        │   │   ├─ profile.parsed.sha256       # SHA-256 of profile.parsed.json
         │   │   └─ profile.response.json       # provenance sidecar (optional)
-        │   └─ profiles.parsed.json
-        # optional aggregate snapshot for the bucket
+        │   └─ profiles.parsed.json           # optional aggregate snapshot
         └─ latest → <as_of_bucket>/            # symlink (or fallback file pointer)
 
 Bucket resolution order for writes:
@@ -21,14 +21,23 @@ Reads default to the "latest" pointer if no bucket is given.
 
 from __future__ import annotations
 
+import hashlib
+import os
 from datetime import date
 from pathlib import Path
-from typing import cast
+from typing import Iterable, cast
 
 from mxm.dataio.models import Response as IoResponse
 from mxm.types import JSONLike
 
-from mxm.datakraken.common.file_io import read_json, write_json
+from mxm.datakraken.common.file_io import (
+    dumps_json,
+    fsync_dir,
+    read_json,
+    write_bytes,
+    write_json,
+    write_json_array,
+)
 from mxm.datakraken.common.latest_bucket import (
     resolve_latest_bucket,
     update_latest_pointer,
@@ -48,17 +57,44 @@ def _profile_dir(base_path: Path, *, bucket: str, isin: str) -> Path:
     return _bucket_dir(base_path, bucket=bucket) / isin
 
 
+def _bucket_root_str(base_path: Path, bucket: str) -> str:
+    """`_bucket_dir` as a plain string, for joining per-ISIN paths in loops."""
+    return os.fspath(_bucket_dir(base_path, bucket=bucket))
+
+
+# ---------------------------
+# Digest sidecar
+# ---------------------------
+
+
+def _write_with_digest_sidecar(path: Path, payload: bytes, *, sync_dir: bool) -> Path:
+    """
+    Atomically write `payload` to `path`, then '<name>.sha256' holding its hex
+    SHA-256 (hashed from `payload`, not re-read from disk).
+
+    The sidecar goes second, so a crash in between leaves a stale digest that
+    no longer matches and `should_skip(verify_hash=True)` refetches.
+    """
+    write_bytes(path, payload, sync_dir=sync_dir)
+    digest = hashlib.sha256(payload).hexdigest()
+    write_bytes(
+        path.with_suffix(".sha256"), (digest + "\n").encode("ascii"), sync_dir=sync_dir
+    )
+    return path
+
+
 # ---------------------------
 # Provenance writer (bucketed)
 # ---------------------------
 
 
 def _write_profile_provenance(
-    base_path: Path,
+    out_dir: str,
     *,
     isin: str,
     bucket: str,
     resp: IoResponse,
+    sync_dir: bool = True,
 ) -> Path:
     meta: JSONLike = {
         "isin": isin,
@@ -71,9 +107,11 @@ def _write_profile_provenance(
         "sequence": resp.sequence,
         "size_bytes": resp.size_bytes,
     }
-    out = _profile_dir(base_path, bucket=bucket, isin=isin) / "profile.response.json"
-    out.parent.mkdir(parents=True, exist_ok=True)
-    return write_json(out, meta)
+    return write_json(
+        Path(os.path.join(out_dir, "profile.response.json")),
+        meta,
+        sync_dir=sync_dir,
+    )
 
 
 # ---------------------------
@@ -88,6 +126,7 @@ def save_profile(
     provenance: IoResponse | None = None,
     as_of_bucket: str | None = None,
     write_latest: bool = True,
+    durable: bool = True,
 ) -> Path:
     """
     Persist a single parsed profile JSON and (optionally) its provenance sidecar,
@@ -95,8 +134,14 @@ def save_profile(
 
     Writes:
         <base>/profiles/<bucket>/<ISIN>/profile.parsed.json
+        <base>/profiles/<bucket>/<ISIN>/profile.parsed.sha256
         <base>/profiles/<bucket>/<ISIN>/profile.response.json (if provenance)
 
+    Each file is fsync'ed before it is renamed into place, so a file that
+    exists is never truncated. With `durable=True` the ISIN directory is then
+    flushed once, making the renames themselves survive a crash; batch loops
+    pass `durable=False`, where a crash can at worst lose the newest files.
+
     Returns:
         Path to 'profile.parsed.json'.
     """
@@ -107,21 +152,57 @@ def save_profile(
         or date.today().isoformat()
     )
 
+    parsed_path = _save_profile_files(
+        profile,
+        _bucket_root_str(base_path, bucket),
+        bucket=bucket,
+        provenance=provenance,
+        durable=durable,
+    )
+
+    if write_latest:
+        update_latest_pointer(base_path / "profiles", bucket)
+
+    return parsed_path
+
+
+def _save_profile_files(
+    profile: JustETFProfile,
+    bucket_root: str,
+    *,
+    bucket: str,
+    provenance: IoResponse | None = None,
+    durable: bool = True,
+) -> Path:
+    """Write one profile's per-ISIN files under the `bucket_root` string."""
     isin = profile.get("isin")
     if not isinstance(isin, str) or not isin:  # pyright: ignore[reportUnnecessaryIsInstance]
         raise ValueError("Profile must include non-empty 'isin' (str)")
 
-    out_dir = _profile_dir(base_path, bucket=bucket, isin=isin)
-    out_dir.mkdir(parents=True, exist_ok=True)
+    # Joined as strings; a Path is only built for the files actually written.
+    out_dir = os.path.join(bucket_root, isin)
+    os.makedirs(out_dir, exist_ok=True)
 
-    parsed_path = out_dir / "profile.parsed.json"
-    write_json(parsed_path, cast(JSONLike, profile))
+    parsed_path = Path(os.path.join(out_dir, "profile.parsed.json"))
+    _write_with_digest_sidecar(
+        parsed_path,
+        dumps_json(cast(JSONLike, profile)),
+        sync_dir=False,
+    )
 
     if provenance is not None:
-        _write_profile_provenance(base_path, isin=isin, bucket=bucket, resp=provenance)
+        _write_profile_provenance(
+            out_dir,
+            isin=isin,
+            bucket=bucket,
+            resp=provenance,
+            sync_dir=False,
+        )
 
-    if write_latest:
-        update_latest_pointer(base_path / "profiles", bucket)
+    # One directory flush covers every rename above. Only it is optional: the
+    # contents are always synced, since `should_skip` trusts any existing file.
+    if durable:
+        fsync_dir(Path(out_dir))
 
     return parsed_path
 
@@ -151,7 +232,7 @@ def load_profile(
 
 
 def save_profiles_snapshot(
-    profiles: list[JustETFProfile],
+    profiles: Iterable[JustETFProfile],
     base_path: Path,
     *,
     provenance: IoResponse | None = None,
@@ -167,6 +248,8 @@ def save_profiles_snapshot(
     Notes:
         - This does **not** write per-ISIN files. Use `save_profile(...)` for that.
         - Kept as a convenience for full-bucket aggregate views and quick inspection.
+        - Profiles are encoded one at a time as they are consumed, so a generator
+          keeps memory flat regardless of the bucket size.
     """
     bucket = (
         getattr(provenance, "as_of_bucket", None)
@@ -177,7 +260,7 @@ def save_profiles_snapshot(
     bucket_root.mkdir(parents=True, exist_ok=True)
 
     agg_path = bucket_root / "profiles.parsed.json"
-    write_json(agg_path, cast(JSONLike, list(profiles)))
+    write_json_array(agg_path, cast(Iterable[JSONLike], profiles))
 
     if write_latest:
         update_latest_pointer(base_path / "profiles", bucket)
@@ -1,12 +1,18 @@
 from __future__ import annotations
 
 import json
+import os
 from pathlib import Path
 
 import pytest
 from mxm.types import JSONLike
 
-from mxm.datakraken.common.file_io import read_json, write_json
+from mxm.datakraken.common.file_io import (
+    append_jsonl,
+    read_json,
+    write_json,
+    write_json_array,
+)
 
 
 def test_write_then_read_roundtrip(tmp_path: Path) -> None:
@@ -58,3 +64,97 @@ def test_pretty_print_and_utf8(tmp_path: Path) -> None:
 
     # Also confirm it parses as JSON
     assert json.loads(raw) == data
+
+
+def test_stdlib_fallback_matches_default_output(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import mxm.datakraken.common.file_io as file_io
+
+    data: JSONLike = {"b": [1, 2.5, None], "a": {"ok": True, "name": "München"}}
+    default_out = write_json(tmp_path / "default.json", data)
+
+    monkeypatch.setattr(file_io, "orjson", None)
+    fallback_out = write_json(tmp_path / "fallback.json", data)
+
+    assert default_out.read_bytes() == fallback_out.read_bytes()
+    assert read_json(fallback_out) == data
+
+
+def test_write_is_atomic_and_leaves_no_temp_files(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    out = tmp_path / "atomic.json"
+    write_json(out, {"v": 1})
+    write_json(out, {"v": 2}, durable=False)
+    assert read_json(out) == {"v": 2}
+    assert [p.name for p in tmp_path.iterdir()] == ["atomic.json"]
+
+    # A failure before the rename must keep the previous content intact.
+    def _replace_fails(_src: object, _dst: object) -> None:
+        raise OSError("simulated crash before rename")
+
+    monkeypatch.setattr(os, "replace", _replace_fails)
+    with pytest.raises(OSError):
+        write_json(out, {"v": 3})
+    assert read_json(out) == {"v": 2}
+    assert [p.name for p in tmp_path.iterdir()] == ["atomic.json"]
+
+
+def test_skip_unchanged_leaves_identical_file_untouched(tmp_path: Path) -> None:
+    out = tmp_path / "data.json"
+    write_json(out, {"a": 1})
+    os.utime(out, ns=(0, 0))
+
+    write_json(out, {"a": 1}, skip_unchanged=True)
+    assert out.stat().st_mtime_ns == 0
+
+    write_json(out, {"a": 2}, skip_unchanged=True)
+    assert out.stat().st_mtime_ns != 0
+    assert read_json(out) == {"a": 2}
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+@pytest.mark.parametrize(
+    "items",
+    [[], [{}], [[], "a\nb"], [{"isin": "A", "data": {"k": [1, None]}}, {"x": "€"}]],
+)
+def test_write_json_array_matches_write_json_of_list(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    items: list[JSONLike],
+    use_orjson: bool,
+) -> None:
+    import mxm.datakraken.common.file_io as file_io
+
+    if not use_orjson:
+        monkeypatch.setattr(file_io, "orjson", None)
+    expected = write_json(tmp_path / "list.json", items).read_bytes()
+    streamed = write_json_array(tmp_path / "stream.json", iter(items))
+    assert streamed.read_bytes() == expected
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_read_json_of_large_file_matches_small_read(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, use_orjson: bool
+) -> None:
+    import mxm.datakraken.common.file_io as file_io
+
+    if not use_orjson:
+        monkeypatch.setattr(file_io, "orjson", None)
+    entries: JSONLike = [
+        {"isin": f"IE{i:010d}", "url": f"https://x/{i}", "name": "München"}
+        for i in range(2000)
+    ]
+    out = write_json(tmp_path / "big.json", entries)
+    assert out.stat().st_size >= file_io._MMAP_MIN_BYTES  # pyright: ignore[reportPrivateUsage]
+    assert read_json(out) == entries
+
+
+def test_append_jsonl_adds_one_compact_line_per_call(tmp_path: Path) -> None:
+    out = tmp_path / "progress.jsonl"
+    append_jsonl(out, {"isin": "A", "status": "ok"})
+    append_jsonl(out, {"isin": "Ä", "status": "err"})
+
+    lines = out.read_text(encoding="utf-8").splitlines()
+    assert lines == ['{"isin":"A","status":"ok"}', '{"isin":"Ä","status":"err"}']
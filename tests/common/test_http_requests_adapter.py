@@ -9,6 +9,7 @@ import pytest
 from mxm.dataio.models import Request
 from mxm.types import JSONObj
 from requests import HTTPError, Response, Session
+from requests.adapters import HTTPAdapter
 
 from mxm.datakraken.common.http_adapter import HttpRequestsAdapter
 
@@ -227,3 +228,14 @@ def test_describe_and_close() -> None:
     session.close = MethodType(_fake_close, session)
     adapter.close()
     assert closed["flag"] is True
+
+
+def test_session_mounts_pooled_adapter() -> None:
+    adapter = HttpRequestsAdapter(pool_connections=4, pool_maxsize=8)
+    session = adapter._session  # type: ignore[attr-defined]
+
+    for prefix in ("https://", "http://"):
+        mounted = session.get_adapter(f"{prefix}example.test/")
+        assert isinstance(mounted, HTTPAdapter)
+        assert mounted._pool_connections == 4  # type: ignore[attr-defined]
+        assert mounted._pool_maxsize == 8  # type: ignore[attr-defined]
@@ -30,6 +30,17 @@ def test_symlink_happy_path(tmp_path: Path) -> None:
     assert resolve_latest_bucket(root) == "2025-10-30"
 
 
+def test_update_to_current_bucket_leaves_symlink_untouched(tmp_path: Path) -> None:
+    root = tmp_path
+    update_latest_pointer(root, "2025-10-30")
+    before = os.lstat(root / "latest")
+
+    update_latest_pointer(root, "2025-10-30")
+    after = os.lstat(root / "latest")
+    assert (after.st_ino, after.st_mtime_ns) == (before.st_ino, before.st_mtime_ns)
+    assert resolve_latest_bucket(root) == "2025-10-30"
+
+
 def test_existing_real_directory_latest_raises(tmp_path: Path) -> None:
     root = tmp_path
     (root / "bucketA").mkdir()
@@ -66,6 +77,25 @@ def test_fallback_marker_when_symlink_not_supported(
     assert resolve_latest_bucket(root) == "bucketB"
 
 
+def test_swap_leaves_no_temp_links_and_fallback_drops_stale_symlink(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    root = tmp_path
+    update_latest_pointer(root, "bucketA")
+    update_latest_pointer(root, "bucketB")
+    assert sorted(p.name for p in root.iterdir()) == ["latest"]
+
+    def _boom(_self: Path, _target: str) -> None:  # noqa: ARG001
+        raise OSError("no symlink perms")
+
+    monkeypatch.setattr(Path, "symlink_to", _boom, raising=True)
+    update_latest_pointer(root, "bucketC")
+
+    # The old 'latest' -> bucketB must not shadow the marker.
+    assert not (root / "latest").is_symlink()
+    assert resolve_latest_bucket(root) == "bucketC"
+
+
 def test_broken_symlink_and_marker_resolution(
     tmp_path: Path, monkeypatch: pytest.MonkeyPatch
 ) -> None:
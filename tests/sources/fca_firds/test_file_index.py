@@ -1,8 +1,42 @@
+from types import MappingProxyType
+from typing import Final, cast
+
 import pytest
 from mxm.types import JSONLike, JSONObj
 
 import mxm.datakraken.sources.fca_firds.file_index as fi
 
+# Canned API payloads, shared by the tests below. The `_source` records are
+# read-only so a test (or the code under test) cannot mutate them for the next.
+_SAMPLE_HITS: Final = cast(
+    JSONLike,
+    {
+        "hits": {
+            "hits": [
+                {
+                    "_source": MappingProxyType(
+                        {
+                            "download_link": "https://data.fca.org.uk/artefacts/FIRDS/FULINS_C_20250101_01of01.zip",
+                            "file_type": "FULINS",
+                            "file_name": "FULINS_C_20250101_01of01.zip",
+                            "publication_date": "2025-01-01",
+                        }
+                    )
+                }
+            ]
+        }
+    },
+)
+
+_LATEST_DATE_HITS: Final = cast(
+    JSONLike,
+    {
+        "hits": {
+            "hits": [{"_source": MappingProxyType({"publication_date": "2025-02-15"})}]
+        }
+    },
+)
+
 # -----------------------------
 # Unit tests with mocked API
 # -----------------------------
@@ -27,50 +61,36 @@ class DummyResp:
             raise RuntimeError(f"HTTP {self.status_code}")
 
 
-def test_discover_files_parses_hits(monkeypatch: pytest.MonkeyPatch) -> None:
-    """Ensure discover_files returns FirdsFile list from sample JSON."""
-
-    sample_json = {
-        "hits": {
-            "hits": [
-                {
-                    "_source": {
-                        "download_link": "https://data.fca.org.uk/artefacts/FIRDS/FULINS_C_20250101_01of01.zip",
-                        "file_type": "FULINS",
-                        "file_name": "FULINS_C_20250101_01of01.zip",
-                        "publication_date": "2025-01-01",
-                    }
-                }
-            ]
-        }
-    }
+@pytest.fixture
+def stub_request(monkeypatch: pytest.MonkeyPatch) -> list[JSONLike]:
+    """Replace the API call; each call pops the next queued response."""
+    responses: list[JSONLike] = []
 
     def fake_request(params: JSONObj, *args: object, **kwargs: object) -> JSONLike:
         _ = params, args, kwargs
-        return sample_json
+        return responses.pop(0)
 
     monkeypatch.setattr(fi, "_request_with_backoff", fake_request)
+    return responses
+
+
+def test_discover_files_parses_hits(stub_request: list[JSONLike]) -> None:
+    """Ensure discover_files returns FirdsFile list from sample JSON."""
+    stub_request.append(_SAMPLE_HITS)
 
     results = fi.discover_files("FULINS", "2025-01-01", "2025-01-01")
     assert len(results) == 1
     f = results[0]
-    assert isinstance(f, fi.FirdsFile)
+    assert type(f) is fi.FirdsFile
     assert f.file_type == "FULINS"
     assert f.file_name.startswith("FULINS_C_")
     assert f.publication_date == "2025-01-01"
     assert f.download_link.startswith("https://")
 
 
-def test_discover_latest_publication_date(monkeypatch: pytest.MonkeyPatch) -> None:
+def test_discover_latest_publication_date(stub_request: list[JSONLike]) -> None:
     """Ensure discover_latest_publication_date extracts latest date."""
-
-    sample_json = {"hits": {"hits": [{"_source": {"publication_date": "2025-02-15"}}]}}
-
-    def fake_request(params: JSONObj, *args: object, **kwargs: object) -> JSONLike:
-        _ = params, args, kwargs
-        return sample_json
-
-    monkeypatch.setattr(fi, "_request_with_backoff", fake_request)
+    stub_request.append(_LATEST_DATE_HITS)
 
     result = fi.discover_latest_publication_date("FULINS")
     assert result == "2025-02-15"
@@ -124,14 +144,25 @@ def test_discover_latest_full_etf_bucket(monkeypatch: pytest.MonkeyPatch) -> Non
 # -----------------------------
 
 
-@pytest.mark.integration
-def test_integration_latest_date_and_files() -> None:
-    """Hit the live FCA FIRDS API (slow, network)."""
+@pytest.fixture(scope="session")
+def firds_snapshot() -> tuple[str | None, list[fi.FirdsFile]]:
+    """Latest FULINS date and its 'C' files from the live API, fetched once."""
     latest_date = fi.discover_latest_publication_date("FULINS")
-    assert latest_date is not None
+    if latest_date is None:
+        return None, []
     files = fi.discover_files(
         "FULINS", latest_date, latest_date, file_name_wildcard="FULINS_C_*"
     )
+    return latest_date, files
+
+
+@pytest.mark.integration
+def test_integration_latest_date_and_files(
+    firds_snapshot: tuple[str | None, list[fi.FirdsFile]],
+) -> None:
+    """Hit the live FCA FIRDS API (slow, network)."""
+    latest_date, files = firds_snapshot
+    assert latest_date is not None
     assert isinstance(files, list)
     # Usually at least one 'C' file is present
-    assert all(isinstance(f, fi.FirdsFile) for f in files)
+    assert all(type(f) is fi.FirdsFile for f in files)
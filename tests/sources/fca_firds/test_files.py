@@ -0,0 +1,229 @@
+from __future__ import annotations
+
+import copy
+import hashlib
+import io
+import threading
+import time
+from pathlib import Path
+from types import TracebackType
+from typing import Mapping, Optional, Type, cast
+
+import pytest
+import requests
+from requests.adapters import HTTPAdapter
+
+import mxm.datakraken.sources.fca_firds.files as files
+from mxm.datakraken.common.file_io import read_json
+from mxm.datakraken.sources.fca_firds.file_index import FirdsFile
+
+# -----------------------------
+# Test doubles
+# -----------------------------
+
+
+class _StubResponse:
+    """Just enough of requests.Response for `_download_one`."""
+
+    def __init__(self, body: bytes) -> None:
+        self.raw = io.BytesIO(body)
+
+    def raise_for_status(self) -> None:
+        return None
+
+    def __enter__(self) -> "_StubResponse":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        _ = exc_type, exc, tb
+        return None
+
+
+class _StubSession:
+    """Serves canned bodies (or raises) per URL; records every GET."""
+
+    def __init__(
+        self,
+        bodies: Mapping[str, bytes | Exception],
+        delays: Optional[Mapping[str, float]] = None,
+    ) -> None:
+        self._bodies = bodies
+        self._delays = delays or {}
+        self._lock = threading.Lock()
+        self.urls: list[str] = []
+        self.threads: set[int] = set()
+        self.closed = False
+
+    def get(self, url: str, **_kwargs: object) -> _StubResponse:
+        with self._lock:
+            self.urls.append(url)
+            self.threads.add(threading.get_ident())
+        time.sleep(self._delays.get(url, 0.0))
+        body = self._bodies[url]
+        if isinstance(body, Exception):
+            raise body
+        return _StubResponse(body)
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def _firds(n: int) -> list[FirdsFile]:
+    return [
+        FirdsFile(
+            file_type="FULINS",
+            file_name=f"FULINS_C_20250101_{i:02d}of{n:02d}.zip",
+            publication_date="2025-01-01",
+            download_link=f"https://example.test/FULINS_{i:02d}.zip",
+        )
+        for i in range(1, n + 1)
+    ]
+
+
+def _body(f: FirdsFile) -> bytes:
+    return f"payload of {f.file_name}".encode()
+
+
+# -----------------------------
+# download_subset
+# -----------------------------
+
+
+def test_download_subset_returns_paths_in_input_order(tmp_path: Path) -> None:
+    selected = _firds(4)
+    # The first file finishes last, so completion order differs from input order.
+    stub = _StubSession(
+        {f.download_link: _body(f) for f in selected},
+        delays={selected[0].download_link: 0.05},
+    )
+
+    paths = files.download_subset(
+        selected,
+        cache_dir=tmp_path,
+        max_workers=4,
+        session=cast(requests.Session, stub),
+    )
+
+    assert [p.name for p in paths] == [f.file_name for f in selected]
+    for f, p in zip(selected, paths, strict=True):
+        assert p.read_bytes() == _body(f)
+        digest = hashlib.sha256(_body(f)).hexdigest()
+        assert p.with_suffix(".sha256").read_text() == digest + "\n"
+
+
+def test_download_subset_keeps_successes_and_reraises_first_error(
+    tmp_path: Path,
+) -> None:
+    selected = _firds(3)
+    boom = requests.ConnectionError("connection reset")
+    bodies: dict[str, bytes | Exception] = {f.download_link: _body(f) for f in selected}
+    bodies[selected[1].download_link] = boom
+    stub = _StubSession(bodies)
+
+    with pytest.raises(requests.ConnectionError) as excinfo:
+        files.download_subset(
+            selected, cache_dir=tmp_path, session=cast(requests.Session, stub)
+        )
+
+    assert excinfo.value is boom
+    # Every download was attempted; the others completed despite the failure.
+    assert sorted(stub.urls) == sorted(f.download_link for f in selected)
+    assert files.is_cached(selected[0], tmp_path)
+    assert not files.is_cached(selected[1], tmp_path)
+    assert files.is_cached(selected[2], tmp_path)
+
+
+def test_download_subset_shares_one_session_across_workers(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    selected = _firds(6)
+    stub = _StubSession(
+        {f.download_link: _body(f) for f in selected},
+        delays={f.download_link: 0.01 for f in selected},
+    )
+    pool_sizes: list[int] = []
+
+    def fake_new_session(pool_size: int) -> requests.Session:
+        pool_sizes.append(pool_size)
+        return cast(requests.Session, stub)
+
+    monkeypatch.setattr(files, "_new_session", fake_new_session)
+
+    files.download_subset(selected, cache_dir=tmp_path, max_workers=3)
+
+    # One session sized to the pool serves every worker, then is closed.
+    assert pool_sizes == [3]
+    assert len(stub.urls) == len(selected)
+    assert len(stub.threads) > 1
+    assert stub.closed
+
+
+def test_download_subset_leaves_a_caller_session_open(tmp_path: Path) -> None:
+    selected = _firds(2)
+    stub = _StubSession({f.download_link: _body(f) for f in selected})
+
+    files.download_subset(
+        selected, cache_dir=tmp_path, session=cast(requests.Session, stub)
+    )
+
+    assert not stub.closed
+
+
+def test_bulk_and_single_download_sessions_retry_alike() -> None:
+    for session in (files._new_session(4), files._get_session()):  # pyright: ignore[reportPrivateUsage]
+        for scheme in ("https://", "http://"):
+            adapter = session.get_adapter(scheme + "example.test")
+            assert isinstance(adapter, HTTPAdapter)
+            assert adapter.max_retries.total == 3
+            assert adapter.max_retries.backoff_factor == 0.3
+        assert session.headers["User-Agent"] == files.UA
+
+
+# -----------------------------
+# Manifest bookkeeping
+# -----------------------------
+
+
+@pytest.mark.parametrize("failing", [None, 2], ids=["all-ok", "one-fails"])
+def test_download_subset_saves_manifest_once(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, failing: Optional[int]
+) -> None:
+    selected = _firds(5)
+    bodies: dict[str, bytes | Exception] = {f.download_link: _body(f) for f in selected}
+    if failing is not None:
+        bodies[selected[failing].download_link] = requests.HTTPError("503")
+    stub = _StubSession(bodies)
+
+    saved: list[files.Manifest] = []
+    real_save = files._save_cache  # pyright: ignore[reportPrivateUsage]
+
+    def counting_save(info: files.CacheInfo) -> None:
+        saved.append(copy.deepcopy(info.manifest))
+        real_save(info)
+
+    monkeypatch.setattr(files, "_save_cache", counting_save)
+
+    ok = [f for i, f in enumerate(selected) if i != failing]
+    try:
+        files.download_subset(
+            selected, cache_dir=tmp_path, session=cast(requests.Session, stub)
+        )
+    except requests.HTTPError:
+        assert failing is not None
+    else:
+        assert failing is None
+
+    # One load-merge-save for the whole subset, holding every successful file.
+    assert len(saved) == 1
+    assert sorted(saved[0]["files"]) == sorted(f.file_name for f in ok)
+    on_disk = cast(files.Manifest, read_json(tmp_path / files.MANIFEST_FILE))
+    assert on_disk == saved[0]
+    for f in ok:
+        entry = on_disk["files"][f.file_name]
+        assert entry["sha256"] == hashlib.sha256(_body(f)).hexdigest()
+        assert entry["download_link"] == f.download_link
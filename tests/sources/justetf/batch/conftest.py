@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import (
+    AbstractSet,
+    Callable,
+    Dict,
+    Literal,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+import pytest
+from mxm.config import MXMConfig
+from mxm.types import JSONObj
+
+import mxm.datakraken.sources.justetf.batch.run as run_mod
+
+
+@pytest.fixture(scope="session")
+def runs_skeleton(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """
+    Create ``<base>/profiles/runs`` once per session and return the runs dir.
+
+    RunLog tests each use their own run_id, so they can share one base path
+    instead of rebuilding the tree under a fresh ``tmp_path`` every time.
+    """
+    runs = tmp_path_factory.mktemp("batch") / "profiles" / "runs"
+    runs.mkdir(parents=True)
+    return runs
+
+
+@pytest.fixture
+def runs_base(runs_skeleton: Path) -> Path:
+    """The shared ``base_path`` that `runs_skeleton` lives under."""
+    return runs_skeleton.parent.parent
+
+
+@pytest.fixture
+def patch_run_mod(
+    monkeypatch: pytest.MonkeyPatch,
+) -> Callable[[Mapping[str, object]], None]:
+    """
+    Return a function that swaps names in the `batch.run` module for doubles.
+
+    Usage in tests:
+        patch_run_mod({"get_profile_index": fake_get_index, ...})
+    """
+
+    def _patch(overrides: Mapping[str, object]) -> None:
+        for name, double in overrides.items():
+            monkeypatch.setattr(run_mod, name, double)
+
+    return _patch
+
+
+SkipFn = Callable[..., Tuple[bool, Optional[str]]]
+ProcessFn = Callable[..., Tuple[str, Optional[JSONObj], str, Optional[str]]]
+
+
+@dataclass(frozen=True)
+class Fakes:
+    """Factories for the `batch.run` collaborators the run_batch tests replace."""
+
+    def make_get_index(
+        self, entries: Sequence[Dict[str, str]], *, cfg: MXMConfig | None = None
+    ) -> Callable[..., Sequence[Dict[str, str]]]:
+        """get_profile_index returning `entries` (checking `cfg` if given)."""
+
+        def fake_get_index(
+            cfg_arg: MXMConfig, base_path: Path, **kwargs: object
+        ) -> Sequence[Dict[str, str]]:
+            if cfg is not None:
+                assert cfg_arg is cfg
+            _ = base_path, kwargs
+            return entries
+
+        return fake_get_index
+
+    def make_should_skip(
+        self, policy: Literal["never", "always", "first"] = "never"
+    ) -> SkipFn:
+        """should_skip that skips never, always, or only on its first call."""
+        calls = {"n": 0}
+
+        def fake_should_skip(
+            *,
+            base_path: Path,
+            bucket: Optional[str],
+            isin: str,
+            force_refresh: bool,
+            verify_hash: bool = False,
+            existing: Optional[AbstractSet[str]] = None,
+        ) -> Tuple[bool, Optional[str]]:
+            _ = base_path, bucket, isin, force_refresh, verify_hash, existing
+            calls["n"] += 1
+            skip = policy == "always" or (policy == "first" and calls["n"] == 1)
+            return (skip, "exists" if skip else None)
+
+        return fake_should_skip
+
+    def make_process_one_entry(
+        self,
+        *,
+        status: Literal["ok", "err"] = "ok",
+        bucket_used: str = "2025-10-30",
+        on_call: Callable[[], None] | None = None,
+    ) -> ProcessFn:
+        """
+        process_one_entry yielding a dummy profile in `bucket_used`, or "boom".
+
+        `on_call` runs first on every call (e.g. to advance a fake clock).
+        """
+
+        def fake_process_one_entry(
+            *,
+            cfg: MXMConfig,
+            base_path: Path,
+            entry: Dict[str, str],
+            bucket: Optional[str],
+            download_html: Callable[..., object],
+            parse: Callable[..., object],
+            save: Callable[..., object],
+            write_latest: bool,
+        ) -> Tuple[str, Optional[JSONObj], str, Optional[str]]:
+            _ = cfg, base_path, bucket, download_html, parse, save, write_latest
+            if on_call is not None:
+                on_call()
+            if status == "err":
+                return ("err", None, bucket_used, "boom")
+            profile: JSONObj = {
+                "isin": entry["isin"],
+                "name": "Dummy",
+                "source_url": entry["url"],
+            }
+            return ("ok", profile, bucket_used, None)
+
+        return fake_process_one_entry
+
+
+@pytest.fixture
+def fakes() -> Fakes:
+    return Fakes()
@@ -1,15 +1,18 @@
 from __future__ import annotations
 
+import hashlib
+import os
 import re
 from dataclasses import dataclass
 from pathlib import Path
-from types import SimpleNamespace
+from types import MappingProxyType, SimpleNamespace
 from typing import Any, Dict, List, Protocol, Tuple, cast
 
 import pytest
 from mxm.config import MXMConfig
 
 from mxm.datakraken.sources.justetf.batch.core import (
+    bucket_existing_isins,
     process_one_entry,
     resolve_bucket,
     should_skip,
@@ -17,6 +20,24 @@ from mxm.datakraken.sources.justetf.batch.core import (
 from mxm.datakraken.sources.justetf.common.models import JustETFProfile
 
 DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+# fullmatch: `$` alone would also accept a trailing newline.
+_date_fullmatch = DATE_RE.fullmatch
+
+# Never read by the code under test; read-only so no test can leak state into it.
+_EMPTY_CFG: MXMConfig = cast(MXMConfig, MappingProxyType({}))
+
+
+def _parsed_path(base: Path, bucket: str, isin: str) -> Path:
+    """<base>/profiles/<bucket>/<isin>/profile.parsed.json, joined in one call."""
+    return Path(os.path.join(base, "profiles", bucket, isin, "profile.parsed.json"))
+
+
+def _write_parsed(base: Path, bucket: str, isin: str) -> Path:
+    """Create an (empty-object) parsed profile so should_skip sees it."""
+    p = _parsed_path(base, bucket, isin)
+    p.parent.mkdir(parents=True, exist_ok=True)
+    p.write_text("{}", encoding="utf-8")
+    return p
 
 
 class SaveFn(Protocol):
@@ -61,13 +82,7 @@ def make_fake_save(tmp_path: Path, sink: List[SaveCall]) -> SaveFn:
             )
         )
         # Return a plausible target path
-        return (
-            tmp_path
-            / "profiles"
-            / as_of_bucket
-            / profile["isin"]
-            / "profile.parsed.json"
-        )
+        return _parsed_path(tmp_path, as_of_bucket, profile["isin"])
 
     return _fake_save
 
@@ -142,68 +157,106 @@ def test_resolve_bucket_falls_back_to_today_when_no_other_source(
         profiles_root=tmp_path,
         today_iso=None,
     )
-    assert DATE_RE.match(out), f"expected YYYY-MM-DD, got {out}"
+    assert _date_fullmatch(out), f"expected YYYY-MM-DD, got {out}"
 
 
 # ---------- should_skip ----------
 
 
-def test_should_skip_false_when_bucket_unknown(tmp_path: Path) -> None:
-    skip, reason = should_skip(
-        base_path=tmp_path, bucket=None, isin="IE00AAA11111", force_refresh=False
-    )
-    assert skip is False and reason is None
-
+@pytest.mark.parametrize(
+    "bucket,isin,force,setup,expect",
+    [
+        # bucket unknown -> never skip
+        (None, "IE00AAA11111", False, None, (False, None)),
+        # force_refresh wins over an existing bucket
+        ("2025-10-30", "IE00AAA11111", True, None, (False, None)),
+        # profiles/<bucket>/<isin>/profile.parsed.json present -> skip
+        ("2025-10-30", "IE00AAA11111", False, "create", (True, "exists")),
+        # bucket known but file missing
+        ("2025-10-30", "IE00BBB22222", False, None, (False, None)),
+    ],
+    ids=["bucket-unknown", "force-refresh", "file-exists", "file-missing"],
+)
+def test_should_skip(
+    tmp_path: Path,
+    bucket: str | None,
+    isin: str,
+    force: bool,
+    setup: str | None,
+    expect: Tuple[bool, str | None],
+) -> None:
+    if setup == "create":
+        assert bucket is not None
+        _write_parsed(tmp_path, bucket, isin)
 
-def test_should_skip_false_when_force_refresh(tmp_path: Path) -> None:
-    skip, reason = should_skip(
-        base_path=tmp_path, bucket="2025-10-30", isin="IE00AAA11111", force_refresh=True
+    assert (
+        should_skip(base_path=tmp_path, bucket=bucket, isin=isin, force_refresh=force)
+        == expect
     )
-    assert skip is False and reason is None
 
 
-def test_should_skip_true_when_bucket_known_and_file_exists(tmp_path: Path) -> None:
-    # create profiles/<bucket>/<isin>/profile.parsed.json
-    p = tmp_path / "profiles" / "2025-10-30" / "IE00AAA11111" / "profile.parsed.json"
-    p.parent.mkdir(parents=True, exist_ok=True)
-    p.write_text("{}", encoding="utf-8")
-
-    skip, reason = should_skip(
-        base_path=tmp_path,
-        bucket="2025-10-30",
-        isin="IE00AAA11111",
-        force_refresh=False,
-    )
-    assert skip is True and reason == "exists"
+def test_should_skip_verify_hash_refetches_on_digest_mismatch(tmp_path: Path) -> None:
+    p = _write_parsed(tmp_path, "2025-10-30", "IE00AAA11111")
+    sidecar = p.with_suffix(".sha256")
+    sidecar.write_text(hashlib.sha256(b"{}").hexdigest() + "\n", encoding="utf-8")
+
+    kwargs: Dict[str, Any] = {
+        "base_path": tmp_path,
+        "bucket": "2025-10-30",
+        "isin": "IE00AAA11111",
+        "force_refresh": False,
+        "verify_hash": True,
+    }
+    assert should_skip(**kwargs) == (True, "exists")
+
+    p.write_text('{"trunc', encoding="utf-8")
+    assert should_skip(**kwargs) == (False, None)
+    # without verification, existence alone still wins
+    assert should_skip(**{**kwargs, "verify_hash": False}) == (True, "exists")
+
+
+def test_bucket_existing_isins_lists_only_parsed_profiles(tmp_path: Path) -> None:
+    bucket_root = tmp_path / "profiles" / "2025-10-30"
+    (bucket_root / "IE00AAA11111").mkdir(parents=True)
+    (bucket_root / "IE00AAA11111" / "profile.parsed.json").write_text("{}")
+    (bucket_root / "IE00BBB22222").mkdir()  # dir without a parsed profile
+    (bucket_root / "profiles.parsed.json").write_text("[]")
+
+    existing = bucket_existing_isins(tmp_path, "2025-10-30")
+    assert existing == {"IE00AAA11111"}
+    assert bucket_existing_isins(tmp_path, "1999-01-01") == set()
+
+    for isin, expected in (("IE00AAA11111", True), ("IE00BBB22222", False)):
+        skip, _ = should_skip(
+            base_path=tmp_path,
+            bucket="2025-10-30",
+            isin=isin,
+            force_refresh=False,
+            existing=existing,
+        )
+        assert skip is expected
 
 
-def test_should_skip_false_when_file_missing(tmp_path: Path) -> None:
-    skip, reason = should_skip(
-        base_path=tmp_path,
-        bucket="2025-10-30",
-        isin="IE00BBB22222",
-        force_refresh=False,
-    )
-    assert skip is False and reason is None
+# ---------- process_one_entry ----------
 
 
-# ---------- process_one_entry ----------
+# process_one_entry only reads these, so one instance each serves every call.
+_RESP_WITH_BUCKET = SimpleNamespace(as_of_bucket="2025-10-30")
+_RESP_NO_BUCKET = SimpleNamespace()  # no as_of_bucket
 
 
 def _fake_download_with_resp_bucket(
     cfg: MXMConfig, isin: str, url: str
 ) -> Tuple[str, object]:
     _ = (cfg, isin, url)
-    resp = SimpleNamespace(as_of_bucket="2025-10-30")
-    return "<html>dummy</html>", resp
+    return "<html>dummy</html>", _RESP_WITH_BUCKET
 
 
 def _fake_download_without_resp_bucket(
     cfg: MXMConfig, isin: str, url: str
 ) -> Tuple[str, object]:
     _ = (cfg, isin, url)
-    resp = SimpleNamespace()  # no as_of_bucket
-    return "<html>dummy</html>", resp
+    return "<html>dummy</html>", _RESP_NO_BUCKET
 
 
 def _fake_parse(html: str, isin: str) -> Dict[str, Any]:
@@ -212,13 +265,12 @@ def _fake_parse(html: str, isin: str) -> Dict[str, Any]:
 
 
 def test_process_one_entry_uses_provided_bucket_and_calls_save(tmp_path: Path) -> None:
-    cfg: MXMConfig = cast(MXMConfig, {})
     entry = {"isin": "IE00AAA11111", "url": "http://dummy/etf"}
     calls: List[SaveCall] = []
     fake_save = make_fake_save(tmp_path, calls)
 
     status, profile, bucket_used, error = process_one_entry(
-        cfg=cfg,
+        cfg=_EMPTY_CFG,
         base_path=tmp_path,
         entry=entry,
         bucket="2025-10-30",
@@ -243,13 +295,12 @@ def test_process_one_entry_uses_provided_bucket_and_calls_save(tmp_path: Path) -
 
 
 def test_process_one_entry_uses_resp_bucket_when_not_provided(tmp_path: Path) -> None:
-    cfg: MXMConfig = cast(MXMConfig, {})
     entry = {"isin": "IE00BBB22222", "url": "http://dummy/etf2"}
     saved: List[SaveCall] = []
     fake_save = make_fake_save(tmp_path, saved)
 
     status, profile, bucket_used, error = process_one_entry(
-        cfg=cfg,
+        cfg=_EMPTY_CFG,
         base_path=tmp_path,
         entry=entry,
         bucket=None,
@@ -271,12 +322,11 @@ def test_process_one_entry_uses_resp_bucket_when_not_provided(tmp_path: Path) ->
 def test_process_one_entry_falls_back_to_today_when_no_buckets_available(
     tmp_path: Path,
 ) -> None:
-    cfg: MXMConfig = cast(MXMConfig, {})
     entry = {"isin": "IE00CCC33333", "url": "http://dummy/etf3"}
     seen: List[SaveCall] = []
     fake_save = make_fake_save(tmp_path, seen)
     status, profile, bucket_used, error = process_one_entry(
-        cfg=cfg,
+        cfg=_EMPTY_CFG,
         base_path=tmp_path,
         entry=entry,
         bucket=None,
@@ -289,14 +339,13 @@ def test_process_one_entry_falls_back_to_today_when_no_buckets_available(
     assert status == "ok"
     assert error is None
     assert profile is not None
-    assert DATE_RE.match(cast(str, bucket_used)), (
+    assert _date_fullmatch(cast(str, bucket_used)), (
         f"expected YYYY-MM-DD, got {bucket_used}"
     )
-    assert seen and DATE_RE.match(seen[0].as_of_bucket)
+    assert seen and _date_fullmatch(seen[0].as_of_bucket)
 
 
 def test_process_one_entry_propagates_errors(tmp_path: Path) -> None:
-    cfg: MXMConfig = cast(MXMConfig, {})
     entry = {"isin": "IE00BAD00001", "url": "http://dummy/boom"}
 
     def boom_download(cfg: MXMConfig, isin: str, url: str) -> Tuple[str, object]:
@@ -307,7 +356,7 @@ def test_process_one_entry_propagates_errors(tmp_path: Path) -> None:
     fake_save = make_fake_save(tmp_path, seen_again)
 
     status, profile, bucket_used, error = process_one_entry(
-        cfg=cfg,
+        cfg=_EMPTY_CFG,
         base_path=tmp_path,
         entry=entry,
         bucket=None,
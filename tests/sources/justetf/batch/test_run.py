@@ -2,7 +2,17 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
-from typing import Callable, Dict, List, Optional, Sequence, Tuple, cast
+from types import MappingProxyType
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    cast,
+)
 
 import pytest
 from mxm.types import JSONLike, JSONObj
@@ -11,81 +21,58 @@ from mxm.config import MXMConfig
 # Target the orchestrator module for monkeypatches
 import mxm.datakraken.sources.justetf.batch.run as run_mod
 
+if TYPE_CHECKING:
+    from tests.sources.justetf.batch.conftest import Fakes
+
+# Bound once so reading progress lines skips the json.loads lookup per line.
+_LOADS = json.JSONDecoder().decode
+
+
+PatchRunMod = Callable[[Mapping[str, object]], None]
+
+_EMPTY_CFG: MXMConfig = cast(MXMConfig, MappingProxyType({}))
+
+
+_ENCODE = json.JSONEncoder(ensure_ascii=False).encode
+
+
+def _write_snapshot(
+    profiles: List[JSONObj],
+    *,
+    base_path: Path,
+    as_of_bucket: str,
+    write_latest: bool,
+) -> Path:
+    """Stand-in for save_profiles_snapshot: plain JSON at the bucketed path."""
+    _ = write_latest
+    p = base_path / "profiles" / as_of_bucket / "profiles.parsed.json"
+    p.parent.mkdir(parents=True, exist_ok=True)
+    p.write_bytes(_ENCODE(profiles).encode())
+    return p
+
 
 def _read_jsonl(path: Path) -> List[JSONObj]:
     txt = path.read_text(encoding="utf-8").strip()
-    return [json.loads(line) for line in txt.splitlines()] if txt else []
+    return list(map(_LOADS, txt.splitlines())) if txt else []
 
 
-def test_happy_two_ok(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
-    cfg: MXMConfig = cast(MXMConfig, {})
+def test_happy_two_ok(tmp_path: Path, patch_run_mod: PatchRunMod, fakes: Fakes) -> None:
     entries: Sequence[Dict[str, str]] = [
         {"isin": "IE00AAA11111", "url": "http://dummy/etf1"},
         {"isin": "IE00BBB22222", "url": "http://dummy/etf2"},
     ]
 
-    # get_profile_index → 2 items
-    def fake_get_index(
-        cfg_arg: MXMConfig,
-        base_path: Path,
-        **kwargs: object,
-    ) -> Sequence[Dict[str, str]]:
-        assert cfg_arg is cfg
-        _ = base_path, kwargs
-        return entries
-
-    # should_skip → never
-    def fake_should_skip(
-        *,
-        base_path: Path,
-        bucket: Optional[str],
-        isin: str,
-        force_refresh: bool,
-    ) -> Tuple[bool, Optional[str]]:
-        _ = base_path, bucket, isin, force_refresh
-        return (False, None)
-
-    # process_one_entry → OK with deterministic bucket
-    def fake_process_one_entry(
-        *,
-        cfg: MXMConfig,
-        base_path: Path,
-        entry: Dict[str, str],
-        bucket: Optional[str],
-        download_html: Callable[..., object],
-        parse: Callable[..., object],
-        save: Callable[..., object],
-        write_latest: bool,
-    ) -> Tuple[str, JSONObj, str, None]:
-        _ = cfg, base_path, bucket, download_html, parse, save, write_latest
-        profile: JSONObj = {
-            "isin": entry["isin"],
-            "name": "Dummy",
-            "source_url": entry["url"],
+    patch_run_mod(
+        {
+            "get_profile_index": fakes.make_get_index(entries, cfg=_EMPTY_CFG),
+            "should_skip": fakes.make_should_skip("never"),
+            "process_one_entry": fakes.make_process_one_entry(),
+            "save_profiles_snapshot": _write_snapshot,
         }
-        return ("ok", profile, "2025-10-30", None)
-
-    # save_profiles_snapshot writes file and returns the path
-    def fake_save_snapshot(
-        profiles: List[JSONObj],
-        *,
-        base_path: Path,
-        as_of_bucket: str,
-        write_latest: bool,
-    ) -> Path:
-        _ = write_latest
-        p = base_path / "profiles" / as_of_bucket / "profiles.parsed.json"
-        p.parent.mkdir(parents=True, exist_ok=True)
-        p.write_text(json.dumps(profiles, ensure_ascii=False), encoding="utf-8")
-        return p
-
-    monkeypatch.setattr(run_mod, "get_profile_index", fake_get_index)
-    monkeypatch.setattr(run_mod, "should_skip", fake_should_skip)
-    monkeypatch.setattr(run_mod, "process_one_entry", fake_process_one_entry)
-    monkeypatch.setattr(run_mod, "save_profiles_snapshot", fake_save_snapshot)
+    )
 
     snapshot = run_mod.run_batch(
-        cfg=cfg,
+        cfg=_EMPTY_CFG,
         base_path=tmp_path,
         write_latest=True,
         rate_seconds=0.0,  # avoid sleep
@@ -111,71 +98,23 @@ def test_happy_two_ok(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
     assert (ok_dir / "IE00BBB22222.ok").exists()
 
 
-def test_skip_then_ok(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
-    cfg: MXMConfig = cast(MXMConfig, {})
+def test_skip_then_ok(tmp_path: Path, patch_run_mod: PatchRunMod, fakes: Fakes) -> None:
     entries: Sequence[Dict[str, str]] = [
         {"isin": "SKIP00000001", "url": "http://dummy/skip"},
         {"isin": "OK0000000002", "url": "http://dummy/ok"},
     ]
 
-    def fake_get_index(
-        cfg_arg: MXMConfig, base_path: Path, **kwargs: object
-    ) -> Sequence[Dict[str, str]]:
-        _ = cfg_arg, base_path, kwargs
-        return entries
-
-    # skip first, then ok
-    calls = {"n": 0}
-
-    def fake_should_skip(
-        *,
-        base_path: Path,
-        bucket: Optional[str],
-        isin: str,
-        force_refresh: bool,
-    ) -> Tuple[bool, Optional[str]]:
-        _ = base_path, bucket, isin, force_refresh
-        calls["n"] += 1
-        return (calls["n"] == 1, "exists" if calls["n"] == 1 else None)
-
-    def fake_process_one_entry(
-        *,
-        cfg: MXMConfig,
-        base_path: Path,
-        entry: Dict[str, str],
-        bucket: Optional[str],
-        download_html: Callable[..., object],
-        parse: Callable[..., object],
-        save: Callable[..., object],
-        write_latest: bool,
-    ) -> Tuple[str, JSONObj, str, None]:
-        _ = cfg, base_path, bucket, download_html, parse, save, write_latest
-        profile: JSONObj = {
-            "isin": entry["isin"],
-            "name": "X",
-            "source_url": entry["url"],
+    patch_run_mod(
+        {
+            "get_profile_index": fakes.make_get_index(entries),
+            # skip first, then ok
+            "should_skip": fakes.make_should_skip("first"),
+            "process_one_entry": fakes.make_process_one_entry(),
+            "save_profiles_snapshot": _write_snapshot,
         }
-        return ("ok", profile, "2025-10-30", None)
-
-    def fake_save_snapshot(
-        profiles: List[JSONObj],
-        *,
-        base_path: Path,
-        as_of_bucket: str,
-        write_latest: bool,
-    ) -> Path:
-        _ = write_latest
-        p = base_path / "profiles" / as_of_bucket / "profiles.parsed.json"
-        p.parent.mkdir(parents=True, exist_ok=True)
-        p.write_text(json.dumps(profiles), encoding="utf-8")
-        return p
-
-    monkeypatch.setattr(run_mod, "get_profile_index", fake_get_index)
-    monkeypatch.setattr(run_mod, "should_skip", fake_should_skip)
-    monkeypatch.setattr(run_mod, "process_one_entry", fake_process_one_entry)
-    monkeypatch.setattr(run_mod, "save_profiles_snapshot", fake_save_snapshot)
+    )
 
-    _ = run_mod.run_batch(cfg, tmp_path, rate_seconds=0.0, run_id="skipok")
+    _ = run_mod.run_batch(_EMPTY_CFG, tmp_path, rate_seconds=0.0, run_id="skipok")
 
     progress = _read_jsonl(tmp_path / "profiles" / "runs" / "skipok" / "progress.jsonl")
     statuses = [r["status"] for r in progress]
@@ -183,92 +122,35 @@ def test_skip_then_ok(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
 
 
 def test_error_flow_logs_and_err_file(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    tmp_path: Path, patch_run_mod: PatchRunMod, fakes: Fakes
 ) -> None:
-    cfg: MXMConfig = cast(MXMConfig, {})
     entries: Sequence[Dict[str, str]] = [
         {"isin": "BAD00000001", "url": "http://dummy/bad"}
     ]
 
-    def fake_get_index(
-        cfg_arg: MXMConfig, base_path: Path, **kwargs: object
-    ) -> Sequence[Dict[str, str]]:
-        _ = cfg_arg, base_path, kwargs
-        return entries
-
-    def fake_should_skip(
-        *,
-        base_path: Path,
-        bucket: Optional[str],
-        isin: str,
-        force_refresh: bool,
-    ) -> Tuple[bool, Optional[str]]:
-        _ = base_path, bucket, isin, force_refresh
-        return (False, None)
-
-    def fake_process_one_entry(
-        *,
-        cfg: MXMConfig,
-        base_path: Path,
-        entry: Dict[str, str],
-        bucket: Optional[str],
-        download_html: Callable[..., object],
-        parse: Callable[..., object],
-        save: Callable[..., object],
-        write_latest: bool,
-    ) -> Tuple[str, None, str, str]:
-        _ = cfg, base_path, entry, bucket, download_html, parse, save, write_latest
-        return ("err", None, "2025-10-30", "boom")
-
-    def fake_save_snapshot(
-        profiles: List[JSONObj],
-        *,
-        base_path: Path,
-        as_of_bucket: str,
-        write_latest: bool,
-    ) -> Path:
-        _ = profiles, write_latest
-        p = base_path / "profiles" / as_of_bucket / "profiles.parsed.json"
-        p.parent.mkdir(parents=True, exist_ok=True)
-        p.write_text("[]", encoding="utf-8")
-        return p
-
-    monkeypatch.setattr(run_mod, "get_profile_index", fake_get_index)
-    monkeypatch.setattr(run_mod, "should_skip", fake_should_skip)
-    monkeypatch.setattr(run_mod, "process_one_entry", fake_process_one_entry)
-    monkeypatch.setattr(run_mod, "save_profiles_snapshot", fake_save_snapshot)
+    patch_run_mod(
+        {
+            "get_profile_index": fakes.make_get_index(entries),
+            "should_skip": fakes.make_should_skip("never"),
+            "process_one_entry": fakes.make_process_one_entry(status="err"),
+            "save_profiles_snapshot": _write_snapshot,
+        }
+    )
 
-    _ = run_mod.run_batch(cfg, tmp_path, rate_seconds=0.0, run_id="errrun")
+    _ = run_mod.run_batch(_EMPTY_CFG, tmp_path, rate_seconds=0.0, run_id="errrun")
 
     progress = _read_jsonl(tmp_path / "profiles" / "runs" / "errrun" / "progress.jsonl")
     assert len(progress) == 1 and progress[0]["status"] == "err"
 
     err_dir = tmp_path / "profiles" / "runs" / "errrun" / "err"
-    assert any(p.name.startswith("BAD00000001") for p in err_dir.glob("*.json"))
+    assert (err_dir / "BAD00000001.json").exists()
 
 
 def test_bucket_resolution_when_all_skipped(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    tmp_path: Path, patch_run_mod: PatchRunMod, fakes: Fakes
 ) -> None:
-    cfg: MXMConfig = cast(MXMConfig, {})
     entries: Sequence[Dict[str, str]] = [{"isin": "X1", "url": "http://dummy/x1"}]
 
-    def fake_get_index(
-        cfg_arg: MXMConfig, base_path: Path, **kwargs: object
-    ) -> Sequence[Dict[str, str]]:
-        _ = cfg_arg, base_path, kwargs
-        return entries
-
-    def fake_should_skip(
-        *,
-        base_path: Path,
-        bucket: Optional[str],
-        isin: str,
-        force_refresh: bool,
-    ) -> Tuple[bool, Optional[str]]:
-        _ = base_path, bucket, isin, force_refresh
-        return (True, "exists")
-
     seen: Dict[str, Optional[str]] = {"bucket": None}
 
     def fake_resolve_bucket(
@@ -290,16 +172,65 @@ def test_bucket_resolution_when_all_skipped(
         write_latest: bool,
     ) -> Path:
         assert as_of_bucket == seen["bucket"]
-        _ = profiles, write_latest
-        p = base_path / "profiles" / as_of_bucket / "profiles.parsed.json"
-        p.parent.mkdir(parents=True, exist_ok=True)
-        p.write_text("[]", encoding="utf-8")
-        return p
-
-    monkeypatch.setattr(run_mod, "get_profile_index", fake_get_index)
-    monkeypatch.setattr(run_mod, "should_skip", fake_should_skip)
-    monkeypatch.setattr(run_mod, "resolve_bucket", fake_resolve_bucket)
-    monkeypatch.setattr(run_mod, "save_profiles_snapshot", fake_save_snapshot)
-
-    snapshot = run_mod.run_batch(cfg, tmp_path, rate_seconds=0.0, run_id="allskip")
+        return _write_snapshot(
+            profiles,
+            base_path=base_path,
+            as_of_bucket=as_of_bucket,
+            write_latest=write_latest,
+        )
+
+    patch_run_mod(
+        {
+            "get_profile_index": fakes.make_get_index(entries),
+            "should_skip": fakes.make_should_skip("always"),
+            "resolve_bucket": fake_resolve_bucket,
+            "save_profiles_snapshot": fake_save_snapshot,
+        }
+    )
+
+    snapshot = run_mod.run_batch(
+        _EMPTY_CFG, tmp_path, rate_seconds=0.0, run_id="allskip"
+    )
     assert snapshot == tmp_path / "profiles" / "2099-01-01" / "profiles.parsed.json"
+
+
+def test_rate_limit_only_sleeps_the_remaining_interval(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    patch_run_mod: PatchRunMod,
+    fakes: Fakes,
+) -> None:
+    entries: Sequence[Dict[str, str]] = [
+        {"isin": "IE00AAA11111", "url": "http://dummy/etf1"},
+        {"isin": "IE00BBB22222", "url": "http://dummy/etf2"},
+    ]
+
+    # Fake clock: each processed entry "takes" 1.5s of the 2.0s interval.
+    clock = {"now": 100.0}
+    sleeps: List[float] = []
+
+    def fake_monotonic() -> float:
+        return clock["now"]
+
+    def fake_sleep(seconds: float) -> None:
+        sleeps.append(seconds)
+        clock["now"] += seconds
+
+    def take_1_5s() -> None:
+        clock["now"] += 1.5
+
+    monkeypatch.setattr(run_mod.time, "monotonic", fake_monotonic)
+    monkeypatch.setattr(run_mod.time, "sleep", fake_sleep)
+    patch_run_mod(
+        {
+            "get_profile_index": fakes.make_get_index(entries),
+            "should_skip": fakes.make_should_skip("never"),
+            "process_one_entry": fakes.make_process_one_entry(on_call=take_1_5s),
+            "save_profiles_snapshot": _write_snapshot,
+        }
+    )
+
+    _ = run_mod.run_batch(_EMPTY_CFG, tmp_path, rate_seconds=2.0, run_id="paced")
+
+    # No wait before the first request; only the 0.5s remainder before the second.
+    assert sleeps == [pytest.approx(0.5)]
@@ -13,19 +13,24 @@ ISO_Z_RE = re.compile(
 RUN_ID_RE = re.compile(
     r"^\d{4}-\d{2}-\d{2}T\d{2}-\d{2}-\d{2}$"
 )  # e.g., 2025-10-30T08-15-00
+_iso_z_fullmatch = ISO_Z_RE.fullmatch
+_run_id_fullmatch = RUN_ID_RE.fullmatch
+
+
+_LOADS = json.JSONDecoder().decode
 
 
 def _read_progress_lines(path: Path) -> List[dict]:
     raw = path.read_text(encoding="utf-8").strip()
-    return [json.loads(line) for line in raw.splitlines()] if raw else []
+    return list(map(_LOADS, raw.splitlines())) if raw else []
 
 
-def test_initializes_layout_and_progress_file(tmp_path: Path) -> None:
-    log = RunLog(tmp_path, run_id="testrun-001")
+def test_initializes_layout_and_progress_file(runs_base: Path) -> None:
+    log = RunLog(runs_base, run_id="testrun-001")
 
     # Directories
-    assert log.runs_root == tmp_path / "profiles" / "runs"
-    assert log.run_dir == tmp_path / "profiles" / "runs" / "testrun-001"
+    assert log.runs_root == runs_base / "profiles" / "runs"
+    assert log.run_dir == runs_base / "profiles" / "runs" / "testrun-001"
     assert log.ok_dir.exists()
     assert log.err_dir.exists()
 
@@ -34,11 +39,11 @@ def test_initializes_layout_and_progress_file(tmp_path: Path) -> None:
     assert log.progress_path.read_text(encoding="utf-8") == ""
 
 
-def test_default_run_id_format(tmp_path: Path) -> None:
-    log = RunLog(tmp_path)  # no run_id provided
-    assert RUN_ID_RE.match(log.run_id), f"unexpected run_id format: {log.run_id}"
+def test_default_run_id_format(runs_base: Path) -> None:
+    log = RunLog(runs_base)  # no run_id provided
+    assert _run_id_fullmatch(log.run_id), f"unexpected run_id format: {log.run_id}"
     # directory created
-    assert (tmp_path / "profiles" / "runs" / log.run_id).exists()
+    assert (runs_base / "profiles" / "runs" / log.run_id).exists()
 
 
 def test_log_appends_jsonl_and_preserves_unicode(tmp_path: Path) -> None:
@@ -56,12 +61,12 @@ def test_log_appends_jsonl_and_preserves_unicode(tmp_path: Path) -> None:
     assert rows[0]["isin"] == "IE00AAA11111" and rows[0]["status"] == "ok"
     assert rows[1]["status"] == "skip" and rows[1]["reason"] == "exists"
     assert rows[2]["status"] == "err" and rows[2]["error"] == "boom 💥"
+    # written as raw UTF-8, not \u escapes
+    assert "boom 💥" in log.progress_path.read_text(encoding="utf-8")
 
     # timestamps are ISO-8601 Z
-    for r in rows:
-        assert "time" in r and ISO_Z_RE.match(r["time"]), (
-            f"bad timestamp: {r.get('time')}"
-        )
+    bad = next((r for r in rows if not _iso_z_fullmatch(r.get("time", ""))), None)
+    assert bad is None, f"bad timestamp: {bad}"
 
 
 def test_extra_does_not_override_standard_fields(tmp_path: Path) -> None:
@@ -75,23 +80,19 @@ def test_extra_does_not_override_standard_fields(tmp_path: Path) -> None:
     rows = _read_progress_lines(log.progress_path)
     assert len(rows) == 1
     rec = rows[0]
-    # standard fields unchanged
-    assert rec["status"] == "ok"
-    assert rec["bucket"] == "2025-10-30"
-    # extra retained
-    assert rec["custom"] == 42
-    # attempted override ignored
-    assert rec.get("status") == "ok"
+    # standard fields unchanged (the "status" override is ignored), extra retained
+    expected = {"status": "ok", "bucket": "2025-10-30", "custom": 42}
+    assert {k: rec.get(k) for k in expected} == expected, rec
 
 
-def test_mark_ok_creates_marker(tmp_path: Path) -> None:
-    log = RunLog(tmp_path, run_id="ok-test")
+def test_mark_ok_creates_marker(runs_base: Path) -> None:
+    log = RunLog(runs_base, run_id="ok-test")
     log.mark_ok("IE00AAA11111")
     assert (log.ok_dir / "IE00AAA11111.ok").exists()
 
 
-def test_mark_err_writes_payload(tmp_path: Path) -> None:
-    log = RunLog(tmp_path, run_id="err-test")
+def test_mark_err_writes_payload(runs_base: Path) -> None:
+    log = RunLog(runs_base, run_id="err-test")
     payload = {"isin": "IE00BAD", "error": "boom", "kind": "network"}
     log.mark_err("IE00BAD", payload)
 
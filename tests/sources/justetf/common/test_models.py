@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+from mxm.datakraken.sources.justetf.common.models import (
+    ETFProfileIndexEntry,
+    ProfileIndex,
+)
+
+
+def test_profile_index_is_a_list_with_a_cached_isin_lookup() -> None:
+    entries: list[ETFProfileIndexEntry] = [
+        {"isin": "IE00DEMO0001", "url": "https://example.com/a"},
+        {"isin": "IE00DEMO0002", "url": "https://example.com/b", "lastmod": "x"},
+    ]
+    index = ProfileIndex(entries)
+
+    assert index == entries
+    assert index.by_isin["IE00DEMO0002"] is entries[1]
+    assert index.by_isin is index.by_isin
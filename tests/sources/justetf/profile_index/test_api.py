@@ -11,6 +11,7 @@ from typing import NoReturn, cast
 
 import pytest
 from mxm.config import MXMConfig
+from mxm.dataio.models import Response as IoResponse
 
 from mxm.datakraken.common.latest_bucket import resolve_latest_bucket
 from mxm.datakraken.sources.justetf.common.models import ETFProfileIndexEntry
@@ -30,7 +31,6 @@ def fake_index() -> list[ETFProfileIndexEntry]:
 
 
 def test_get_profile_index_first_run(
-    monkeypatch: pytest.MonkeyPatch,
     tmp_path: Path,
     fake_index: list[ETFProfileIndexEntry],
 ) -> None:
@@ -38,35 +38,32 @@ def test_get_profile_index_first_run(
     a bucket and update 'latest'."""
     cfg: MXMConfig = cast(MXMConfig, {})  # patched build ignores cfg
 
-    def _fake_resp(tmp: Path) -> SimpleNamespace:
+    def _fake_resp(tmp: Path) -> IoResponse:
         payload = tmp / "sitemap.bin"
-        payload.write_bytes(b"<xml/>")
-        return SimpleNamespace(
+        size_bytes = payload.write_bytes(b"<xml/>")  # returns the bytes written
+        resp = SimpleNamespace(
             id="resp-1",
             request_id="req-1",
             path=str(payload),
             checksum=None,
             sequence=None,
-            size_bytes=payload.stat().st_size,
+            size_bytes=size_bytes,
             created_at=dt.datetime.now(dt.timezone.utc),
             verify=lambda _: True,  # type: ignore[no-any-return]
             # no as_of_bucket -> api will fall back to today
         )
+        return cast(IoResponse, resp)
 
     def fake_build(
         *_args: object, **_kwargs: object
-    ) -> tuple[list[ETFProfileIndexEntry], SimpleNamespace]:
+    ) -> tuple[list[ETFProfileIndexEntry], IoResponse]:
         _ = _args
         _ = _kwargs
         return fake_index, _fake_resp(tmp_path)
 
-    monkeypatch.setattr(
-        "mxm.datakraken.sources.justetf.profile_index.api.build_profile_index",
-        fake_build,
-        raising=True,
+    results: list[ETFProfileIndexEntry] = get_profile_index(
+        cfg, tmp_path, build=fake_build
     )
-
-    results: list[ETFProfileIndexEntry] = get_profile_index(cfg, tmp_path)
     assert results == fake_index
 
     # Latest pointer exists and resolves to a bucket
@@ -80,7 +77,6 @@ def test_get_profile_index_first_run(
 
 
 def test_get_profile_index_force_refresh(
-    monkeypatch: pytest.MonkeyPatch,
     tmp_path: Path,
     fake_index: list[ETFProfileIndexEntry],
 ) -> None:
@@ -89,43 +85,37 @@ def test_get_profile_index_force_refresh(
 
     calls: dict[str, int] = {"count": 0}
 
-    def _fake_resp(tmp: Path) -> SimpleNamespace:
+    def _fake_resp(tmp: Path) -> IoResponse:
         payload = tmp / "sitemap.bin"
-        payload.write_bytes(b"<xml/>")
-        return SimpleNamespace(
+        size_bytes = payload.write_bytes(b"<xml/>")  # returns the bytes written
+        resp = SimpleNamespace(
             id="resp-1",
             request_id="req-1",
             path=str(payload),
             checksum=None,
             sequence=None,
-            size_bytes=payload.stat().st_size,
+            size_bytes=size_bytes,
             created_at=dt.datetime.now(dt.timezone.utc),
             verify=lambda _: True,  # type: ignore[no-any-return]
         )
+        return cast(IoResponse, resp)
 
     def fake_build(
         *_args: object, **_kwargs: object
-    ) -> tuple[list[ETFProfileIndexEntry], SimpleNamespace]:
+    ) -> tuple[list[ETFProfileIndexEntry], IoResponse]:
         _ = _args
         _ = _kwargs
         calls["count"] += 1
         return fake_index, _fake_resp(tmp_path)
 
-    monkeypatch.setattr(
-        "mxm.datakraken.sources.justetf.profile_index.api.build_profile_index",
-        fake_build,
-        raising=True,
-    )
-
     # Call twice with force_refresh=True
-    _ = get_profile_index(cfg, tmp_path, force_refresh=True)
-    _ = get_profile_index(cfg, tmp_path, force_refresh=True)
+    _ = get_profile_index(cfg, tmp_path, force_refresh=True, build=fake_build)
+    _ = get_profile_index(cfg, tmp_path, force_refresh=True, build=fake_build)
 
     assert calls["count"] == 2
 
 
 def test_get_profile_index_bucket_selection(
-    monkeypatch: pytest.MonkeyPatch,
     tmp_path: Path,
     fake_index: list[ETFProfileIndexEntry],
 ) -> None:
@@ -146,18 +136,13 @@ def test_get_profile_index_bucket_selection(
             "build_profile_index should not be called for existing bucket load"
         )
 
-    monkeypatch.setattr(
-        "mxm.datakraken.sources.justetf.profile_index.api.build_profile_index",
-        _boom,
-        raising=True,
-    )
-
     # Request the older bucket explicitly
     results: list[ETFProfileIndexEntry] = get_profile_index(
         cfg,
         tmp_path,
         as_of_bucket="2025-09-30",
         force_refresh=False,
+        build=_boom,
     )
     assert results == fake_index
 
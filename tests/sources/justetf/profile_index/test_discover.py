@@ -8,15 +8,19 @@ import hashlib
 from contextlib import contextmanager
 from pathlib import Path
 from types import SimpleNamespace, TracebackType
-from typing import Iterator, Optional, Type, cast
+from typing import Iterator, NoReturn, Optional, Type, cast
 
 import pytest
+from mxm.dataio.models import Response as IoResponse
 from mxm.types import JSONObj
 from mxm.config import MXMConfig
 
+import mxm.datakraken.sources.justetf.profile_index.discover as discover_mod
+from mxm.datakraken.sources.justetf.common.models import ETFProfileIndexEntry
 from mxm.datakraken.sources.justetf.profile_index.discover import (
     build_profile_index,
 )
+from mxm.datakraken.sources.justetf.profile_index.persistence import save_profile_index
 
 
 class _DummyIoResponse:
@@ -25,17 +29,22 @@ class _DummyIoResponse:
     def __init__(self, path: Path, checksum: str) -> None:
         self.path: str = str(path)
         self.checksum: str = checksum
+        self._digest: bytes = bytes.fromhex(checksum)
 
     def verify(self, data: bytes) -> bool:
-        return hashlib.sha256(data).hexdigest() == self.checksum
+        # Raw digests: no hex encoding on the verify path.
+        return hashlib.sha256(data).digest() == self._digest
 
 
 class _DummyIo:
     """Context manager that mimics DataIoSession enough for the test."""
 
-    def __init__(self, payload_path: Path) -> None:
+    def __init__(self, payload_path: Path, checksum: Optional[str] = None) -> None:
         self._payload_path: Path = payload_path
-        self._checksum: str = hashlib.sha256(payload_path.read_bytes()).hexdigest()
+        if checksum is None:
+            with payload_path.open("rb") as fh:
+                checksum = hashlib.file_digest(fh, "sha256").hexdigest()
+        self._checksum: str = checksum
         self.requests: list[SimpleNamespace] = []
 
     def __enter__(self) -> "_DummyIo":
@@ -60,18 +69,25 @@ class _DummyIo:
         return _DummyIoResponse(self._payload_path, self._checksum)
 
 
+@pytest.fixture(scope="module")
+def sample_sitemap() -> tuple[bytes, str]:
+    """The sample sitemap fixture's bytes and SHA-256, read once per module."""
+    sample_path: Path = Path(__file__).parent.parent / "data" / "sample_sitemap.xml"
+    xml_bytes = sample_path.read_bytes()
+    return xml_bytes, hashlib.sha256(xml_bytes).hexdigest()
+
+
 def test_build_profile_index_from_sample_via_dataio(
-    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, sample_sitemap: tuple[bytes, str]
 ) -> None:
     """Ensure build_profile_index works correctly on a sample sitemap fixture
     using DataIO."""
     # Prepare a fake DataIO payload file
-    sample_path: Path = Path(__file__).parent.parent / "data" / "sample_sitemap.xml"
-    xml_bytes: bytes = sample_path.read_bytes()
+    xml_bytes, checksum = sample_sitemap
     payload_path = tmp_path / "sitemap.xml"
     payload_path.write_bytes(xml_bytes)
 
-    dummy_io = _DummyIo(payload_path)
+    dummy_io = _DummyIo(payload_path, checksum)
 
     # Patch the helper used by discover.py to open a session
     @contextmanager
@@ -104,3 +120,86 @@ def test_build_profile_index_from_sample_via_dataio(
     assert req.kind == "sitemap"
     assert req.params["method"] == "GET"
     assert req.params["headers"]["Accept"] == "application/xml"
+
+
+def test_build_profile_index_returns_persisted_index_for_same_payload(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """If the bucket on disk was built from this payload, the XML is not read."""
+    payload_path = tmp_path / "sitemap.xml"
+    payload_path.write_bytes(b"<urlset/>")
+    checksum = hashlib.sha256(b"<urlset/>").hexdigest()
+    resp = SimpleNamespace(
+        path=str(payload_path),
+        checksum=checksum,
+        as_of_bucket="2025-10-30",
+        cache_tag="tag-1",
+    )
+
+    class _Io(_DummyIo):
+        def fetch(self, _req: object) -> SimpleNamespace:  # type: ignore[override]
+            _ = _req
+            return resp
+
+    @contextmanager
+    def _patched_open_justetf_session(_cfg: MXMConfig) -> Iterator[_DummyIo]:
+        _ = _cfg
+        yield _Io(payload_path)
+
+    def _boom(_resp: object) -> NoReturn:
+        raise AssertionError("payload should not be parsed")
+
+    monkeypatch.setattr(
+        "mxm.datakraken.sources.justetf.profile_index.discover.open_justetf_session",
+        _patched_open_justetf_session,
+        raising=True,
+    )
+    monkeypatch.setattr(discover_mod, "_parse_response_payload", _boom, raising=True)
+
+    persisted: list[ETFProfileIndexEntry] = [
+        {"isin": "IE00AAA11111", "url": "https://example.test/en/x?isin=IE00AAA11111"}
+    ]
+    base_path = tmp_path / "base"
+    save_profile_index(
+        persisted, base_path, provenance=cast(IoResponse, resp), write_latest=False
+    )
+
+    cfg: MXMConfig = cast(MXMConfig, {})
+    entries, _ = build_profile_index(cfg, sitemap_url="dummy", base_path=base_path)
+    assert entries == persisted
+
+
+_ONE_URL_SITEMAP = (
+    b'<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">'
+    b"<url><loc>https://example.test/en/etf-profile.html?isin=IE00AAA11111"
+    b"</loc></url></urlset>"
+)
+
+
+@pytest.mark.parametrize("use_lxml", [True, False])
+@pytest.mark.parametrize(
+    "payload,expected_isins",
+    [(_ONE_URL_SITEMAP, ["IE00AAA11111"]), (b"<urlset><url><loc>x", [])],
+    ids=["valid", "malformed"],
+)
+def test_parse_response_payload_verifies_the_bytes_it_parses(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+    use_lxml: bool,
+    payload: bytes,
+    expected_isins: list[str],
+) -> None:
+    if not use_lxml:
+        monkeypatch.setattr(discover_mod, "lxml_etree", None)
+    payload_path = tmp_path / "sitemap.xml"
+    payload_path.write_bytes(payload)
+    parse = discover_mod._parse_response_payload  # pyright: ignore[reportPrivateUsage]
+
+    good = _DummyIoResponse(payload_path, hashlib.sha256(payload).hexdigest())
+    entries = parse(cast(IoResponse, good))
+    assert [e["isin"] for e in entries] == expected_isins
+
+    # The digest covers the whole file, even past where the parser stopped.
+    bad = _DummyIoResponse(payload_path, hashlib.sha256(payload[:-1]).hexdigest())
+    with pytest.raises(ValueError, match="checksum mismatch"):
+        parse(cast(IoResponse, bad))
@@ -6,9 +6,14 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
+from types import SimpleNamespace
+from typing import cast
 
 import pytest
+from mxm.dataio.models import Response as IoResponse
 
+import mxm.datakraken.common.file_io as file_io
+import mxm.datakraken.sources.justetf.profile_index.persistence as pi_persistence
 from mxm.datakraken.common.latest_bucket import resolve_latest_bucket
 from mxm.datakraken.sources.justetf.profile_index.discover import ETFProfileIndexEntry
 from mxm.datakraken.sources.justetf.profile_index.persistence import save_profile_index
@@ -45,7 +50,7 @@ def test_save_profile_index_bucketed(tmpdir_path: Path) -> None:
     assert outpath.parent.parent.name == "profile_index"
 
     # Content check
-    data: list[ETFProfileIndexEntry] = json.loads(outpath.read_text(encoding="utf-8"))
+    data: list[ETFProfileIndexEntry] = json.loads(outpath.read_bytes())
     assert len(data) == 2
     assert data[0]["isin"] == "TEST123"
 
@@ -68,3 +73,21 @@ def test_save_profile_index_no_latest(tmpdir_path: Path) -> None:
     # No latest pointer should be resolvable when none exists
     pi_root = tmpdir_path / "profile_index"
     assert resolve_latest_bucket(pi_root) is None
+
+
+def test_save_profile_index_syncs_bucket_dir_once(
+    tmpdir_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    synced: list[Path] = []
+    monkeypatch.setattr(file_io, "fsync_dir", synced.append)
+    monkeypatch.setattr(pi_persistence, "fsync_dir", synced.append)
+
+    resp = cast(IoResponse, SimpleNamespace(checksum="abc", cache_tag="t"))
+    index: list[ETFProfileIndexEntry] = [{"isin": "ABC", "url": "https://x/abc"}]
+    out = save_profile_index(
+        index, tmpdir_path, provenance=resp, as_of_bucket="2025-10-02"
+    )
+
+    # parsed index + provenance sidecar, but a single directory flush
+    assert (out.parent / "profile_index.response.json").exists()
+    assert synced == [out.parent]
@@ -4,6 +4,7 @@ Tests for loading ETF Profile Index snapshots from disk (bucketed layout).
 
 from __future__ import annotations
 
+import copy
 from pathlib import Path
 from typing import List
 
@@ -15,44 +16,53 @@ from mxm.datakraken.sources.justetf.profile_index.persistence import (
     save_profile_index,
 )
 
+_INDEX: list[ETFProfileIndexEntry] = [
+    {
+        "isin": "TEST123",
+        "url": "https://example.com/en/etf-profile.html?isin=TEST123",
+        "lastmod": "2025-10-01",
+    },
+    {
+        "isin": "TEST456",
+        "url": "https://example.com/en/etf-profile.html?isin=TEST456",
+    },
+]
+
 
 @pytest.fixture
 def index() -> list[ETFProfileIndexEntry]:
-    return [
-        {
-            "isin": "TEST123",
-            "url": "https://example.com/en/etf-profile.html?isin=TEST123",
-            "lastmod": "2025-10-01",
-        },
-        {
-            "isin": "TEST456",
-            "url": "https://example.com/en/etf-profile.html?isin=TEST456",
-        },
-    ]
-
-
-def test_load_latest(tmp_path: Path, index: List[ETFProfileIndexEntry]) -> None:
+    return copy.deepcopy(_INDEX)
+
+
+@pytest.fixture(scope="module")
+def two_bucket_base(tmp_path_factory: pytest.TempPathFactory) -> Path:
     """
-    When no bucket is provided, loader should use the 'latest' pointer.
+    Base path with buckets 2025-09-30 and 2025-10-02 ('latest' -> 2025-10-02),
+    written once per module. Tests using it must only read.
     """
-    # First bucket
-    save_profile_index(index, tmp_path, as_of_bucket="2025-10-01")
-    # Second bucket (also becomes latest)
-    save_profile_index(index, tmp_path, as_of_bucket="2025-10-05")
+    base = tmp_path_factory.mktemp("pi-read")
+    for bucket in ("2025-09-30", "2025-10-02"):
+        save_profile_index(_INDEX, base, as_of_bucket=bucket)
+    return base
 
-    loaded: List[ETFProfileIndexEntry] = load_profile_index(tmp_path)
+
+def test_load_latest(two_bucket_base: Path, index: List[ETFProfileIndexEntry]) -> None:
+    """
+    When no bucket is provided, loader should use the 'latest' pointer.
+    """
+    loaded = load_profile_index(two_bucket_base)
     assert loaded == index
+    assert loaded.by_isin["TEST456"] == index[1]
 
 
-def test_load_exact_bucket(tmp_path: Path, index: List[ETFProfileIndexEntry]) -> None:
+def test_load_exact_bucket(
+    two_bucket_base: Path, index: List[ETFProfileIndexEntry]
+) -> None:
     """
     With an explicit as_of_bucket, load exactly that bucket without consulting 'latest'.
     """
-    save_profile_index(index, tmp_path, as_of_bucket="2025-09-30")
-    save_profile_index(index, tmp_path, as_of_bucket="2025-10-02")
-
     loaded: List[ETFProfileIndexEntry] = load_profile_index(
-        tmp_path, as_of_bucket="2025-09-30"
+        two_bucket_base, as_of_bucket="2025-09-30"
     )
     assert loaded == index
 
@@ -73,6 +83,32 @@ def test_load_lexicographic_fallback_when_no_latest(
     assert loaded == index
 
 
+def test_lexicographic_fallback_picks_last_bucket_and_ignores_files(
+    tmp_path: Path, index: List[ETFProfileIndexEntry]
+) -> None:
+    save_profile_index(
+        index[:1], tmp_path, as_of_bucket="2025-09-30", write_latest=False
+    )
+    save_profile_index(index, tmp_path, as_of_bucket="2025-10-02", write_latest=False)
+    # A stray file sorting after every bucket must not be picked.
+    (tmp_path / "profile_index" / "zz-notes.txt").write_text("x", encoding="utf-8")
+
+    assert load_profile_index(tmp_path) == index
+
+
+def test_lexicographic_fallback_sees_new_buckets(
+    tmp_path: Path, index: List[ETFProfileIndexEntry]
+) -> None:
+    """The fallback lists the directory on every call, so new buckets show up."""
+    save_profile_index(
+        index[:1], tmp_path, as_of_bucket="2025-09-30", write_latest=False
+    )
+    assert load_profile_index(tmp_path) == index[:1]
+
+    save_profile_index(index, tmp_path, as_of_bucket="2025-10-02", write_latest=False)
+    assert load_profile_index(tmp_path) == index
+
+
 def test_load_no_buckets_raises(tmp_path: Path) -> None:
     """
     If profile_index/ does not exist (or has no buckets), raise FileNotFoundError.
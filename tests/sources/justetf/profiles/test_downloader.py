@@ -14,7 +14,10 @@ import pytest
 from mxm.types import JSONObj
 from mxm.config import MXMConfig
 
-from mxm.datakraken.sources.justetf.profiles.downloader import download_etf_profile_html
+from mxm.datakraken.sources.justetf.profiles.downloader import (
+    download_etf_profile_html,
+    shared_session_fetcher,
+)
 
 # --- DataIO test doubles ------------------------------------------------------
 
@@ -22,13 +25,14 @@ from mxm.datakraken.sources.justetf.profiles.downloader import download_etf_prof
 class _DummyIoResponse:
     """Minimal stand-in for mxm_dataio.models.Response."""
 
-    def __init__(self, path: Path) -> None:
+    def __init__(self, path: Path, digest: bytes) -> None:
         self.path: str = str(path)
-        self._bytes: bytes = path.read_bytes()
-        self.checksum: str = hashlib.sha256(self._bytes).hexdigest()
+        self.checksum: str = digest.hex()
+        self._digest: bytes = digest
 
     def verify(self, data: bytes) -> bool:
-        return hashlib.sha256(data).hexdigest() == self.checksum
+        # Raw digests: no hex encoding on the verify path.
+        return hashlib.sha256(data).digest() == self._digest
 
 
 class _DummyIo:
@@ -41,6 +45,11 @@ class _DummyIo:
         raise_on_fetch: Optional[Exception] = None,
     ) -> None:
         self._payload_path: Optional[Path] = payload_path
+        # Hashed once here; every fetch hands out the same digest.
+        self._digest: bytes = b""
+        if payload_path is not None:
+            with payload_path.open("rb") as fh:
+                self._digest = hashlib.file_digest(fh, "sha256").digest()
         self._raise: Optional[Exception] = raise_on_fetch
         self.requests: list[SimpleNamespace] = []
 
@@ -68,7 +77,7 @@ class _DummyIo:
         assert self._payload_path is not None, (
             "payload_path must be set for success path"
         )
-        return _DummyIoResponse(self._payload_path)
+        return _DummyIoResponse(self._payload_path, self._digest)
 
 
 # --- Tests -------------------------------------------------------------------
@@ -131,3 +140,36 @@ def test_download_etf_profile_html_failure(monkeypatch: pytest.MonkeyPatch) -> N
         _ = download_etf_profile_html(
             cfg, "TEST123", "https://example.test/etf-profile.html?isin=TEST123"
         )
+
+
+def test_shared_session_fetcher_opens_one_session_lazily(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """The batch fetcher opens a single session, and only when first used."""
+    payload_path = tmp_path / "profile.html"
+    payload_path.write_bytes(b"<html><h1>ETF Test</h1></html>")
+    dummy_io = _DummyIo(payload_path=payload_path)
+    opened: list[MXMConfig] = []
+
+    @contextmanager
+    def _patched_open_justetf_session(_cfg: MXMConfig) -> Iterator[_DummyIo]:
+        opened.append(_cfg)
+        yield dummy_io
+
+    monkeypatch.setattr(
+        "mxm.datakraken.sources.justetf.profiles.downloader.open_justetf_session",
+        _patched_open_justetf_session,
+        raising=True,
+    )
+
+    cfg: MXMConfig = cast(MXMConfig, {})
+    with shared_session_fetcher(cfg):
+        pass
+    assert opened == []
+
+    with shared_session_fetcher(cfg) as fetch:
+        raw1, _ = fetch(cfg, "TEST1", "https://example.test/1")
+        raw2, _ = fetch(cfg, "TEST2", "https://example.test/2")
+    assert raw1 == raw2 == payload_path.read_bytes()
+    assert len(opened) == 1
+    assert [r.kind for r in dummy_io.requests] == ["profile_html", "profile_html"]
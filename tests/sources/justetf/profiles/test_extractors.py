@@ -60,3 +60,59 @@ def test_extract_listings_table_against_golden() -> None:
         (GOLDEN_DIR / "listings_table.json").read_text(encoding="utf-8")
     )
     assert got == expected
+
+
+def test_extract_data_table_orders_val_before_val2_and_skips_unlabelled() -> None:
+    html = """
+    <table class="etf-data-table"><tbody>
+      <tr><td class="vallabel">TER</td>
+          <td><span class="val2">p.a.</span><div class="val">0.07%</div></td></tr>
+      <tr><td class="vallabel">Size</td><td>EUR <b>1</b> m</td></tr>
+      <tr><td>no label</td><td>ignored</td></tr>
+      <tr><td class="vallabel">Lonely</td></tr>
+    </tbody></table>
+    """
+    got = extract_data_table(BeautifulSoup(html, "html.parser"))
+    assert got == {"TER": "0.07% p.a.", "Size": "EUR 1 m"}
+
+
+def test_extract_listings_with_and_without_table_sections() -> None:
+    rows = "<tr><td>XETRA</td><td>EUR</td></tr><tr><td>partial</td></tr>"
+    sectioned = f"""
+    <div id="stock-exchange"></div>
+    <table class="mobile-table">
+      <thead><tr><th>Exchange</th><th>Fund\xa0currency</th></tr></thead>
+      <tbody>{rows}</tbody>
+    </table>
+    """
+    bare = f"""
+    <div id="stock-exchange"></div>
+    <table class="mobile-table">
+      <tr><th>Exchange</th><th>Fund currency</th></tr>{rows}
+    </table>
+    """
+    expected = [{"Exchange": "XETRA", "Fund currency": "EUR"}]
+    assert extract_listings(BeautifulSoup(sectioned, "html.parser")) == expected
+    # No thead/tbody: nothing matches "thead th" / "tbody tr".
+    assert extract_listings(BeautifulSoup(bare, "html.parser")) == []
+
+
+def test_extract_listings_reads_every_thead_and_tbody() -> None:
+    anchor = '<div id="stock-exchange"></div>'
+    two_bodies = f"""{anchor}
+    <table class="mobile-table">
+      <thead><tr><th>A</th></tr></thead>
+      <tbody><tr><td>1</td></tr></tbody>
+      <tbody><tr><td>3</td></tr></tbody>
+    </table>
+    """
+    two_header_rows = f"""{anchor}
+    <table class="mobile-table">
+      <thead><tr><th>A</th></tr><tr><th>B</th></tr></thead>
+      <tbody><tr><td>1</td><td>2</td></tr></tbody>
+    </table>
+    """
+    got = extract_listings(BeautifulSoup(two_bodies, "html.parser"))
+    assert got == [{"A": "1"}, {"A": "3"}]
+    got = extract_listings(BeautifulSoup(two_header_rows, "html.parser"))
+    assert got == [{"A": "1", "B": "2"}]
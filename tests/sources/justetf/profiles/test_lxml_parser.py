@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import pytest
+from bs4 import BeautifulSoup
+
+from mxm.datakraken.sources.justetf.profiles import parser
+
+lxml_parser = pytest.importorskip("mxm.datakraken.sources.justetf.profiles.lxml_parser")
+
+_TRICKY_HTML = """
+<html><body>
+<h1><span>Demo</span> &amp; Co<!-- hidden --><script>var x;</script></h1>
+<div id="etf-description-content">
+  <div>Tracks the index ,broadly .</div><p>not a div</p>
+  <div><style>.a{}</style> Second<br>line ; end</div>
+</div>
+<table class="wide etf-data-table">
+  <tr><td class="vallabel">TER<!-- c --></td>
+      <td><div class="val val2">0.07%</div><span class="val2">p.a.</span></td></tr>
+  <tr><td class="vallabel">Nested</td>
+      <td><table><tr><td>inner</td></tr></table></td></tr>
+  <tr><td class="vallabel">Empty</td><td> </td></tr>
+</table>
+<div id="stock-exchange">
+  <table class="mobile-table">
+    <thead><tr><th>Exchange</th><th>Fund&nbsp;currency</th></tr></thead>
+    <tbody><tr><td>XETRA</td><td><b>EU</b>R</td></tr><tr><td>partial</td></tr></tbody>
+  </table>
+</div>
+</body></html>
+"""
+
+
+_TWO_BODIES_HTML = """
+<div id="stock-exchange"></div>
+<table class="mobile-table">
+  <thead><tr><th>A</th></tr></thead>
+  <tbody><tr><td>1</td></tr></tbody>
+  <tbody><tr><td>3</td></tr></tbody>
+</table>
+"""
+
+_TWO_HEADER_ROWS_HTML = """
+<div id="stock-exchange"></div>
+<table class="mobile-table">
+  <thead><tr><th>A</th></tr><tr><th>B</th></tr></thead>
+  <tbody><tr><td>1</td><td>2</td></tr></tbody>
+</table>
+"""
+
+
+@pytest.mark.parametrize(
+    ("html", "listings"),
+    [
+        (_TRICKY_HTML, [{"Exchange": "XETRA", "Fund currency": "EUR"}]),
+        (_TWO_BODIES_HTML, [{"A": "1"}, {"A": "3"}]),
+        (_TWO_HEADER_ROWS_HTML, [{"A": "1", "B": "2"}]),
+    ],
+    ids=["tricky", "two-tbody", "two-row-thead"],
+)
+def test_xpath_extractors_match_bs4_helpers(
+    html: str, listings: list[dict[str, str]]
+) -> None:
+    soup = BeautifulSoup(html, "html.parser")
+    root = lxml_parser.parse_document(html)
+
+    assert lxml_parser.extract_name(root) == parser.extract_name(soup)
+    assert lxml_parser.extract_description(root) == parser.extract_description(soup)
+    assert lxml_parser.extract_data_table(root) == parser.extract_data_table(soup)
+    assert lxml_parser.extract_listings(root) == parser.extract_listings(soup)
+    assert lxml_parser.extract_listings(root) == listings
+
+
+def test_comments_and_pis_inside_a_value_cell_are_skipped() -> None:
+    html = (
+        '<table class="etf-data-table"><tr><td class="vallabel">TER</td>'
+        '<td><!-- c --><?pi x?><span class="val">0.20%</span></td></tr></table>'
+    )
+    soup = BeautifulSoup(html, "html.parser")
+    root = lxml_parser.parse_document(html)
+
+    assert lxml_parser.extract_data_table(root) == {"TER": "0.20%"}
+    assert parser.extract_data_table(soup) == {"TER": "0.20%"}
+    assert parser.parse_profile(html, "IE00DEMO0001").get("data") == {"TER": "0.20%"}
+
+
+def test_parse_document_tolerates_empty_page() -> None:
+    root = lxml_parser.parse_document("")
+    assert lxml_parser.extract_name(root) == ""
+    assert lxml_parser.extract_data_table(root) == {}
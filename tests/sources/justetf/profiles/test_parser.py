@@ -7,7 +7,14 @@ from __future__ import annotations
 import json
 from pathlib import Path
 
-from mxm.datakraken.sources.justetf.profiles.parser import parse_profile
+import pytest
+from bs4 import BeautifulSoup
+
+import mxm.datakraken.sources.justetf.profiles.parser as parser_mod
+from mxm.datakraken.sources.justetf.profiles.parser import (
+    parse_profile,
+    parse_profile_bytes,
+)
 
 DATA_DIR = Path(__file__).parent.parent / "data"
 HTML_PATH = DATA_DIR / "sample_etf.html"
@@ -28,3 +35,153 @@ def test_parse_profile_matches_golden() -> None:
     expected.pop("last_fetched", None)
 
     assert actual == expected
+
+
+_MINI_HTML = """
+<html><body>
+  <h1> Demo ETF </h1>
+  <div id="etf-description-content">
+    <div>Tracks   the index .</div><div>Second part ;</div>
+  </div>
+  <table class="etf-data-table">
+    <tr><td class="vallabel">TER</td><td><div class="val">0.07%</div></td></tr>
+    <tr><td class="vallabel">Size</td><td>EUR 1 m</td></tr>
+  </table>
+  <div id="stock-exchange"></div>
+  <table class="mobile-table">
+    <thead><tr><th>Exchange</th><th>Ticker</th></tr></thead>
+    <tbody><tr><td>XETRA</td><td>DEMO</td></tr></tbody>
+  </table>
+</body></html>
+"""
+
+
+def test_lxml_and_html_parser_builders_agree(monkeypatch: pytest.MonkeyPatch) -> None:
+    """The lxml/XPath fast path must yield the same profile as html.parser."""
+    pytest.importorskip("lxml")
+
+    monkeypatch.setattr(parser_mod, "_HTML_PARSER", "lxml")
+    fast = parse_profile(_MINI_HTML, "IE00DEMO0001", source_url="u")
+    monkeypatch.setattr(parser_mod, "_HTML_PARSER", "html.parser")
+    slow = parse_profile(_MINI_HTML, "IE00DEMO0001", source_url="u")
+
+    fast.pop("last_fetched", None)
+    slow.pop("last_fetched", None)
+    assert fast == slow
+    assert fast["data"] == {"TER": "0.07%", "Size": "EUR 1 m"}
+
+
+def test_lxml_path_skips_extractors_for_sections_the_page_lacks(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    pytest.importorskip("lxml")
+    from mxm.datakraken.sources.justetf.profiles import lxml_parser
+
+    def _unexpected(_root: object) -> object:
+        raise AssertionError("extractor ran for an absent section")
+
+    monkeypatch.setattr(parser_mod, "_HTML_PARSER", "lxml")
+    for helper in ("extract_description", "extract_data_table", "extract_listings"):
+        monkeypatch.setattr(lxml_parser, helper, _unexpected)
+
+    got = parse_profile("<html><body><h1>Bare ETF</h1></body></html>", "IE00BARE0001")
+    assert (got["name"], got["description"]) == ("Bare ETF", "")
+    assert (got["data"], got["listings"]) == ({}, [])
+
+
+@pytest.mark.parametrize("builder", ["lxml", "html.parser"])
+def test_parse_profile_bytes_matches_parse_profile(
+    builder: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    if builder == "lxml":
+        pytest.importorskip("lxml")
+    monkeypatch.setattr(parser_mod, "_HTML_PARSER", builder)
+    stamp = "2025-10-30T12:00:00+00:00"
+    html = _MINI_HTML.replace("Demo ETF", "Démo ETF")
+    expected = parse_profile(html, "IE00DEMO0001", "u", last_fetched=stamp)
+
+    got = parse_profile_bytes(html.encode(), "IE00DEMO0001", "u", last_fetched=stamp)
+    assert got == expected
+    latin = parse_profile_bytes(
+        html.encode("latin-1"),
+        "IE00DEMO0001",
+        "u",
+        last_fetched=stamp,
+        encoding="latin-1",
+    )
+    assert latin == expected
+
+
+def test_parse_profile_reuses_tree_builder_per_thread(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(parser_mod, "_HTML_PARSER", "html.parser")
+    first = parse_profile(_MINI_HTML, "IE00DEMO0001")
+    builder = parser_mod._tree_builder()
+    second = parse_profile(_MINI_HTML.replace("Demo ETF", "Other"), "IE00DEMO0002")
+
+    assert "html.parser" in builder.features
+    assert parser_mod._tree_builder() is builder
+    assert (first["name"], second["name"]) == ("Demo ETF", "Other")
+
+
+def test_section_filter_matches_full_tree_extraction() -> None:
+    """parse_profile builds only the needed sub-trees; output must not change."""
+    html = _MINI_HTML.replace(
+        "<body>", '<body><div class="nav"><table><tr><td>noise</td></tr></table></div>'
+    )
+    full = BeautifulSoup(html, "html.parser")
+    got = parse_profile(html, "IE00DEMO0001", source_url="u")
+
+    assert got["name"] == parser_mod.extract_name(full)
+    assert got["description"] == parser_mod.extract_description(full)
+    assert got["data"] == parser_mod.extract_data_table(full)
+    assert got["listings"] == parser_mod.extract_listings(full)
+    assert got["listings"] == [{"Exchange": "XETRA", "Ticker": "DEMO"}]
+
+
+def test_single_walk_finds_the_same_sections_as_the_helpers(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    # Listings table nested in the anchor, a later h1, and a table carrying
+    # both classes: each helper's "first match" rule must still hold.
+    html = """
+    <div id="stock-exchange"><table class="mobile-table">
+      <thead><tr><th>Exchange</th></tr></thead><tbody><tr><td>XETRA</td></tr></tbody>
+    </table></div>
+    <h1>Late name</h1><h1>Second</h1>
+    <table class="mobile-table etf-data-table">
+      <tr><td class="vallabel">TER</td><td>0.07%</td></tr>
+    </table>
+    """
+    monkeypatch.setattr(parser_mod, "_HTML_PARSER", "html.parser")
+    full = BeautifulSoup(html, "html.parser")
+    got = parse_profile(html, "IE00DEMO0001")
+
+    assert got["name"] == parser_mod.extract_name(full) == "Late name"
+    assert got["data"] == parser_mod.extract_data_table(full) == {"TER": "0.07%"}
+    assert got["listings"] == parser_mod.extract_listings(full)
+    assert got["listings"] == [{"Exchange": "XETRA"}]
+
+
+@pytest.mark.parametrize("builder", ["lxml", "html.parser"])
+def test_repeated_labels_and_headers_share_one_string(
+    builder: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    if builder == "lxml":
+        pytest.importorskip("lxml")
+    monkeypatch.setattr(parser_mod, "_HTML_PARSER", builder)
+    first = parse_profile(_MINI_HTML, "IE00DEMO0001")
+    second = parse_profile(_MINI_HTML, "IE00DEMO0002")
+
+    for a, b in zip(first["data"], second["data"], strict=True):
+        assert a is b
+    for a, b in zip(first["listings"][0], second["listings"][0], strict=True):
+        assert a is b
+
+
+def test_parse_profile_uses_given_last_fetched() -> None:
+    stamp = "2025-10-30T12:00:00+00:00"
+    got = parse_profile(_MINI_HTML, "IE00DEMO0001", last_fetched=stamp)
+    assert got["last_fetched"] == stamp
+    assert parse_profile(_MINI_HTML, "IE00DEMO0001")["last_fetched"] != stamp
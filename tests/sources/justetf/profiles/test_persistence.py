@@ -1,12 +1,18 @@
 from __future__ import annotations
 
+import datetime as dt
+import hashlib
 import json
 from pathlib import Path
+from types import SimpleNamespace
 from typing import Any, cast
 
 import pytest
+from mxm.dataio.models import Response as IoResponse
 from mxm.types import JSONLike
 
+import mxm.datakraken.common.file_io as file_io
+import mxm.datakraken.sources.justetf.profiles.persistence as persistence
 from mxm.datakraken.common.file_io import read_json
 from mxm.datakraken.common.latest_bucket import resolve_latest_bucket
 from mxm.datakraken.sources.justetf.common.models import JustETFProfile
@@ -51,6 +57,80 @@ def test_save_profile_writes_file_bucketed(
     assert loaded["name"] == "Test ETF"
 
 
+@pytest.mark.parametrize(
+    "durable,expected",
+    [(True, (3, 1)), (False, (3, 0))],
+    ids=["durable", "batch"],
+)
+def test_save_profile_flushes_the_directory_only_when_durable(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    sample_profile: JustETFProfile,
+    durable: bool,
+    expected: tuple[int, int],
+) -> None:
+    file_syncs: list[int] = []
+    dir_syncs: list[Path] = []
+    monkeypatch.setattr(file_io.os, "fsync", file_syncs.append)
+    monkeypatch.setattr(file_io, "fsync_dir", dir_syncs.append)
+    monkeypatch.setattr(persistence, "fsync_dir", dir_syncs.append)
+
+    resp = cast(
+        IoResponse,
+        SimpleNamespace(
+            id="resp-1",
+            request_id="req-1",
+            checksum=None,
+            path=None,
+            created_at=dt.datetime(2025, 10, 30, tzinfo=dt.timezone.utc),
+            sequence=None,
+            size_bytes=0,
+        ),
+    )
+    path = save_profile(
+        sample_profile,
+        tmp_path,
+        provenance=resp,
+        as_of_bucket="2025-10-30",
+        write_latest=False,
+        durable=durable,
+    )
+
+    # parsed profile, digest and provenance are always synced before their
+    # rename; only the single ISIN directory flush depends on `durable`
+    assert (path.parent / "profile.response.json").exists()
+    assert (len(file_syncs), len(dir_syncs)) == expected
+    assert dir_syncs in ([], [path.parent])
+
+
+def test_save_profile_digest_sidecar_is_atomic(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, sample_profile: JustETFProfile
+) -> None:
+    path = save_profile(sample_profile, tmp_path, as_of_bucket="2025-10-30")
+    sidecar = path.with_suffix(".sha256")
+    first = sidecar.read_text(encoding="utf-8")
+    assert first == hashlib.sha256(path.read_bytes()).hexdigest() + "\n"
+
+    # A crash while replacing the sidecar keeps the previous digest whole.
+    real_replace = file_io.os.replace
+
+    def failing_replace(src: str | Path, dst: str | Path) -> None:
+        if Path(dst) == sidecar:
+            raise OSError("disk full")
+        real_replace(src, dst)
+
+    monkeypatch.setattr(file_io.os, "replace", failing_replace)
+    changed = cast(JustETFProfile, {**sample_profile, "name": "Renamed ETF"})
+    with pytest.raises(OSError, match="disk full"):
+        save_profile(changed, tmp_path, as_of_bucket="2025-10-30")
+
+    assert sidecar.read_text(encoding="utf-8") == first
+    assert sorted(p.name for p in path.parent.iterdir()) == [
+        "profile.parsed.json",
+        "profile.parsed.sha256",
+    ]
+
+
 def test_save_profile_missing_isin(tmp_path: Path) -> None:
     """Ensure save_profile raises ValueError if no ISIN."""
     bad_profile: dict[str, Any] = {